@@ -0,0 +1,189 @@
+"""
+Generated `from_dict` constructors for the contract dataclasses.
+
+Each contract declares its coercion rules once, through its field annotations.
+`generated_from_dict` turns those rules into a specialized function. The
+function is compiled once per class at import time. It reads fields with
+direct `d[...]` / `d.get(...)` calls, binds its helpers as locals, and calls
+the constructor positionally.
+
+Annotation rules (annotations are strings under `from __future__ import annotations`):
+- `int` / `float` / `str`: required key, coerced (`int(d["x"])`)
+- `bool`: optional key, `bool(d.get("x", False))`
+- `X | None`: optional key, `None` stays `None`, otherwise coerced as `X`
+- `list[X]`: optional key, missing/empty -> `[]`, elements coerced as `X`
+- `tuple[X, ...]`: as `list[X]`, materialized as a tuple (missing/empty -> `()`)
+- `dict[...]`: optional key, shallow copy, missing/empty -> `{}`
+- contract dataclass: nested `X.from_dict(d["x"])`
+- `str` Enum: member looked up by `str(d["x"])` (unknown values raise `ValueError`)
+
+When every `int` / `float` / `str` / `bool` field already holds exactly that type (the
+normal case for artifacts written by this codebase), the constructor is called on the raw
+values and the coercion calls are skipped. Inputs from other producers (numeric strings,
+ints for floats, ...) still go through the coercing path and give the same result.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import sys
+from enum import Enum
+from typing import Any, Callable
+
+_SCALARS = {"int": "_int", "float": "_float", "str": "_str"}
+
+
+def _conv_expr(
+    type_name: str, value: str, ns: dict[str, Any], module_ns: dict[str, Any], *, intern: bool = False
+) -> str:
+    if intern and type_name == "str":
+        return f"_intern(_str({value}))"
+    if type_name in _SCALARS:
+        return f"{_SCALARS[type_name]}({value})"
+    t = module_ns.get(type_name)
+    if isinstance(t, type) and issubclass(t, Enum):
+        # Direct value->member dict hit; EnumMeta.__call__ only runs for unknown values,
+        # so those still raise the usual ValueError.
+        ns[f"_{type_name}"] = t
+        ns[f"_{type_name}_get"] = {m.value: m for m in t}.get
+        return f"(_{type_name}_get(_str({value})) or _{type_name}(_str({value})))"
+    if isinstance(t, type) and dataclasses.is_dataclass(t) and hasattr(t, "from_dict"):
+        ns[f"_{type_name}_from_dict"] = t.from_dict
+        return f"_{type_name}_from_dict({value})"
+    raise TypeError(f"generated_from_dict: unsupported annotation {type_name!r}")
+
+
+def build_from_dict(
+    cls: type,
+    *,
+    defaults: dict[str, Any] | None = None,
+    converters: dict[str, Callable[[Any], Any]] | None = None,
+    checked_lists: dict[str, str] | None = None,
+    interned: tuple[str, ...] = (),
+) -> Callable[[dict[str, Any]], Any]:
+    """
+    Compile a `from_dict(d)` function for dataclass `cls`.
+
+    - `defaults`: fallback value for a key that may be missing (`d.get(name, default)`).
+    - `converters`: callable applied to the raw `d.get(name)` value instead of annotation rules.
+    - `checked_lists`: list fields that must be a list; value is the TypeError message.
+    - `interned`: `str` / `tuple[str, ...]` fields whose strings go through `sys.intern`
+      (ids repeated across cross-references collapse to one object).
+    """
+
+    defaults = defaults or {}
+    converters = converters or {}
+    checked_lists = checked_lists or {}
+    module_ns = vars(sys.modules[cls.__module__])
+    ns: dict[str, Any] = {
+        "_cls": cls,
+        "_type": type,
+        "_int": int,
+        "_float": float,
+        "_str": str,
+        "_bool": bool,
+        "_dict": dict,
+        "_tuple": tuple,
+        "_intern": sys.intern,
+        "_EMPTY": (),
+    }
+
+    prelude: list[str] = []
+    for name, message in checked_lists.items():
+        ns[f"_msg_{name}"] = message
+        prelude.append(f"    v_{name} = d.get({name!r}) or []")
+        prelude.append(f"    if not isinstance(v_{name}, list):")
+        prelude.append(f"        raise TypeError(_msg_{name})")
+
+    args: list[str] = []
+    # Fast path: scalar fields are read into locals once; when every one already has its
+    # exact target type (artifacts written by this codebase), the constructor is called on
+    # the raw values. Anything else (strings from external producers, ints for floats, ...)
+    # takes the coercing call below.
+    fast_args: list[str] = []
+    checks: list[str] = []
+    for f in dataclasses.fields(cls):
+        if not f.init:
+            continue
+        name = f.name
+        ann = str(f.type).strip()
+
+        n_args = len(args)
+        if name in converters:
+            ns[f"_cv_{name}"] = converters[name]
+            args.append(f"_cv_{name}(d.get({name!r}))")
+            fast_args.append(args[-1])
+            continue
+
+        optional = ann.endswith("| None")
+        if optional:
+            ann = ann[: -len("| None")].strip()
+
+        seq = None
+        if ann.startswith("list[") and ann.endswith("]"):
+            seq, elem_ann = "{}", ann[len("list[") : -1]
+        elif ann.startswith("tuple[") and ann.endswith(", ...]"):
+            seq, elem_ann = "_tuple({})", ann[len("tuple[") : -len(", ...]")]
+        if seq is not None:
+            # Always a list comprehension. Measured on CPython 3.11 (20k elements):
+            # list(map(...)) is ~2x slower (specialized inline calls win), and a
+            # preallocated `[None] * n` filled by index is ~1.6x slower (LIST_APPEND
+            # growth is amortized; the index loop is not).
+            elem = _conv_expr(elem_ann.strip(), "x", ns, module_ns, intern=name in interned)
+            if name in checked_lists:
+                args.append(seq.format(f"[{elem} for x in v_{name}]"))
+            elif optional:
+                prelude.append(f"    v_{name} = d.get({name!r})")
+                args.append(f"(None if v_{name} is None else {seq.format(f'[{elem} for x in v_{name}]')})")
+            else:
+                args.append(seq.format(f"[{elem} for x in (d.get({name!r}) or _EMPTY)]"))
+        elif ann.startswith("dict["):
+            args.append(f"_dict(d.get({name!r}) or {{}})")
+        elif ann == "bool":
+            prelude.append(f"    v_{name} = d.get({name!r}, False)")
+            checks.append(f"_type(v_{name}) is _bool")
+            fast_args.append(f"v_{name}")
+            args.append(f"_bool(v_{name})")
+        elif name in defaults:
+            ns[f"_default_{name}"] = defaults[name]
+            prelude.append(f"    v_{name} = d.get({name!r}, _default_{name})")
+            args.append(_conv_expr(ann, f"v_{name}", ns, module_ns))
+            if ann in _SCALARS:
+                checks.append(f"_type(v_{name}) is {_SCALARS[ann]}")
+                fast_args.append(f"v_{name}")
+        elif optional:
+            prelude.append(f"    v_{name} = d.get({name!r})")
+            args.append(f"(None if v_{name} is None else {_conv_expr(ann, f'v_{name}', ns, module_ns)})")
+            if ann in _SCALARS:
+                checks.append(f"(v_{name} is None or _type(v_{name}) is {_SCALARS[ann]})")
+                fast_args.append(f"v_{name}")
+        elif ann in _SCALARS:
+            prelude.append(f"    v_{name} = d[{name!r}]")
+            args.append(_conv_expr(ann, f"v_{name}", ns, module_ns, intern=name in interned))
+            checks.append(f"_type(v_{name}) is {_SCALARS[ann]}")
+            fast_args.append(f"_intern(v_{name})" if name in interned and ann == "str" else f"v_{name}")
+        else:
+            args.append(_conv_expr(ann, f"d[{name!r}]", ns, module_ns, intern=name in interned))
+        if len(fast_args) == n_args:
+            fast_args.append(args[-1])
+
+    bound = ", ".join(f"{k}={k}" for k in ns)
+    lines = [f"def from_dict(d, *, {bound}):", *prelude]
+    if checks and fast_args != args:
+        lines += [f"    if {' and '.join(checks)}:", "        return _cls(", *(f"            {a}," for a in fast_args), "        )"]
+    src = "\n".join([*lines, "    return _cls(", *(f"        {a}," for a in args), "    )"])
+    exec(compile(src, f"<generated {cls.__qualname__}.from_dict>", "exec"), ns)
+    fn = ns["from_dict"]
+    fn.__qualname__ = f"{cls.__qualname__}.from_dict"
+    fn.__module__ = cls.__module__
+    return fn
+
+
+def generated_from_dict(**options: Any) -> Callable[[type], type]:
+    """Class decorator: attach a generated `from_dict` staticmethod (see `build_from_dict`)."""
+
+    def deco(cls: type) -> type:
+        cls.from_dict = staticmethod(build_from_dict(cls, **options))
+        return cls
+
+    return deco
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+from ._codegen import generated_from_dict
 from .ocr import BBox
 
 
@@ -15,114 +16,99 @@ class RegionType(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
+@generated_from_dict(interned=("line_id", "token_ids"))
 @dataclass(frozen=True, slots=True)
 class Line:
     # docs/architecture/03_MODULE_CONTRACTS.md recommended format:
     # p{page_num:03d}_l{line_index:06d}
     line_id: str
     page_num: int
-    token_ids: list[str]  # ordered reading order within line
+    token_ids: tuple[str, ...]  # ordered reading order within line
     line_bbox: BBox
 
-    def to_dict(self) -> dict[str, Any]:
+    def __post_init__(self) -> None:
+        # Ids are stored as tuples; a list from the caller is converted so instances built directly
+        # compare and hash like the ones from `from_dict`.
+        if type(self.token_ids) is not tuple:
+            object.__setattr__(self, "token_ids", tuple(self.token_ids))
+
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
         return {
             "line_id": self.line_id,
             "page_num": self.page_num,
-            "token_ids": list(self.token_ids),
+            "token_ids": list(self.token_ids) if copy else self.token_ids,
             "line_bbox": self.line_bbox.to_dict(),
         }
 
-    @staticmethod
-    def from_dict(d: dict[str, Any]) -> "Line":
-        return Line(
-            line_id=str(d["line_id"]),
-            page_num=int(d["page_num"]),
-            token_ids=[str(x) for x in (d.get("token_ids") or [])],
-            line_bbox=BBox.from_dict(d["line_bbox"]),
-        )
-
 
+@generated_from_dict(interned=("block_id", "line_ids"))
 @dataclass(frozen=True, slots=True)
 class Block:
     block_id: str  # p{page_num:03d}_b{block_index:06d}
     page_num: int
-    line_ids: list[str]  # ordered reading order within block
+    line_ids: tuple[str, ...]  # ordered reading order within block
     block_bbox: BBox
 
-    def to_dict(self) -> dict[str, Any]:
+    def __post_init__(self) -> None:
+        if type(self.line_ids) is not tuple:
+            object.__setattr__(self, "line_ids", tuple(self.line_ids))
+
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
         return {
             "block_id": self.block_id,
             "page_num": self.page_num,
-            "line_ids": list(self.line_ids),
+            "line_ids": list(self.line_ids) if copy else self.line_ids,
             "block_bbox": self.block_bbox.to_dict(),
         }
 
-    @staticmethod
-    def from_dict(d: dict[str, Any]) -> "Block":
-        return Block(
-            block_id=str(d["block_id"]),
-            page_num=int(d["page_num"]),
-            line_ids=[str(x) for x in (d.get("line_ids") or [])],
-            block_bbox=BBox.from_dict(d["block_bbox"]),
-        )
-
 
+@generated_from_dict(interned=("region_id", "block_ids"))
 @dataclass(frozen=True, slots=True)
 class Region:
     region_id: str  # p{page_num:03d}_r{region_index:06d}
     page_num: int
     region_type: RegionType
-    block_ids: list[str]  # ordered
+    block_ids: tuple[str, ...]  # ordered
     region_bbox: BBox
 
-    def to_dict(self) -> dict[str, Any]:
+    def __post_init__(self) -> None:
+        if type(self.block_ids) is not tuple:
+            object.__setattr__(self, "block_ids", tuple(self.block_ids))
+
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
         return {
             "region_id": self.region_id,
             "page_num": self.page_num,
             "region_type": self.region_type.value,
-            "block_ids": list(self.block_ids),
+            "block_ids": list(self.block_ids) if copy else self.block_ids,
             "region_bbox": self.region_bbox.to_dict(),
         }
 
-    @staticmethod
-    def from_dict(d: dict[str, Any]) -> "Region":
-        return Region(
-            region_id=str(d["region_id"]),
-            page_num=int(d["page_num"]),
-            region_type=RegionType(str(d["region_type"])),
-            block_ids=[str(x) for x in (d.get("block_ids") or [])],
-            region_bbox=BBox.from_dict(d["region_bbox"]),
-        )
-
 
+@generated_from_dict(interned=("cell_id", "token_ids"))
 @dataclass(frozen=True, slots=True)
 class CellCandidate:
     cell_id: str  # p{page_num:03d}_c{cell_index:06d}
     page_num: int
     bbox: BBox
-    token_ids: list[str]  # ordered
+    token_ids: tuple[str, ...]  # ordered
     score: float | None  # deterministic, conservative (not probabilistic weight)
 
-    def to_dict(self) -> dict[str, Any]:
+    def __post_init__(self) -> None:
+        if type(self.token_ids) is not tuple:
+            object.__setattr__(self, "token_ids", tuple(self.token_ids))
+
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
         return {
             "cell_id": self.cell_id,
             "page_num": self.page_num,
             "bbox": self.bbox.to_dict(),
-            "token_ids": list(self.token_ids),
+            "token_ids": list(self.token_ids) if copy else self.token_ids,
             "score": self.score,
         }
 
-    @staticmethod
-    def from_dict(d: dict[str, Any]) -> "CellCandidate":
-        return CellCandidate(
-            cell_id=str(d["cell_id"]),
-            page_num=int(d["page_num"]),
-            bbox=BBox.from_dict(d["bbox"]),
-            token_ids=[str(x) for x in (d.get("token_ids") or [])],
-            score=(None if d.get("score") is None else float(d["score"])),
-        )
-
 
+@generated_from_dict()
 @dataclass(frozen=True, slots=True)
 class GroupedPage:
     page_num: int
@@ -131,33 +117,20 @@ class GroupedPage:
     regions: list[Region] | None
     cell_candidates: list[CellCandidate] | None
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
         out: dict[str, Any] = {
             "page_num": self.page_num,
-            "lines": [l.to_dict() for l in self.lines],
-            "blocks": [b.to_dict() for b in self.blocks],
+            "lines": [l.to_dict(copy=copy) for l in self.lines],
+            "blocks": [b.to_dict(copy=copy) for b in self.blocks],
         }
-        out["regions"] = None if self.regions is None else [r.to_dict() for r in self.regions]
+        out["regions"] = None if self.regions is None else [r.to_dict(copy=copy) for r in self.regions]
         out["cell_candidates"] = (
-            None if self.cell_candidates is None else [c.to_dict() for c in self.cell_candidates]
+            None if self.cell_candidates is None else [c.to_dict(copy=copy) for c in self.cell_candidates]
         )
         return out
 
-    @staticmethod
-    def from_dict(d: dict[str, Any]) -> "GroupedPage":
-        lines_raw = d.get("lines") or []
-        blocks_raw = d.get("blocks") or []
-        regions_raw = d.get("regions")
-        cells_raw = d.get("cell_candidates")
-        return GroupedPage(
-            page_num=int(d["page_num"]),
-            lines=[Line.from_dict(x) for x in lines_raw],
-            blocks=[Block.from_dict(x) for x in blocks_raw],
-            regions=(None if regions_raw is None else [Region.from_dict(x) for x in regions_raw]),
-            cell_candidates=(None if cells_raw is None else [CellCandidate.from_dict(x) for x in cells_raw]),
-        )
-
 
+@generated_from_dict()
 @dataclass(frozen=True, slots=True)
 class GroupingResult:
     ok: bool
@@ -168,29 +141,15 @@ class GroupingResult:
     source_image_relpath: str | None
     doc_id: str | None = None
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
         out: dict[str, Any] = {
             "ok": self.ok,
-            "errors": list(self.errors),
-            "meta": dict(self.meta),
-            "pages": [p.to_dict() for p in self.pages],
+            "errors": list(self.errors) if copy else self.errors,
+            "meta": dict(self.meta) if copy else self.meta,
+            "pages": [p.to_dict(copy=copy) for p in self.pages],
             "source_ocr_relpath": self.source_ocr_relpath,
             "source_image_relpath": self.source_image_relpath,
         }
         if self.doc_id is not None:
             out["doc_id"] = self.doc_id
         return out
-
-    @staticmethod
-    def from_dict(d: dict[str, Any]) -> "GroupingResult":
-        pages_raw = d.get("pages") or []
-        return GroupingResult(
-            ok=bool(d.get("ok", False)),
-            errors=[str(x) for x in (d.get("errors") or [])],
-            meta=dict(d.get("meta") or {}),
-            pages=[GroupedPage.from_dict(p) for p in pages_raw],
-            source_ocr_relpath=(None if d.get("source_ocr_relpath") is None else str(d.get("source_ocr_relpath"))),
-            source_image_relpath=(None if d.get("source_image_relpath") is None else str(d.get("source_image_relpath"))),
-            doc_id=(None if d.get("doc_id") is None else str(d.get("doc_id"))),
-        )
-
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from copy import deepcopy
+from dataclasses import dataclass
 from typing import Any
 
 from .grouping_doc_mode import GroupError
@@ -14,6 +15,15 @@ class GroupDocPageRef:
     ok: bool
     errors: list[GroupError]
 
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
+        return {
+            "page_num": self.page_num,
+            "source_ocr_relpath": self.source_ocr_relpath,
+            "group_out_relpath": self.group_out_relpath,
+            "ok": self.ok,
+            "errors": [e.to_dict(copy=copy) for e in self.errors],
+        }
+
 
 @dataclass(frozen=True, slots=True)
 class GroupDocResult:
@@ -24,6 +34,14 @@ class GroupDocResult:
     errors: list[GroupError]
     meta: dict[str, Any]
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
+        # Same copy semantics as GroupPageResult.to_dict (meta deep-copied unless copy=False).
+        return {
+            "doc_id": self.doc_id,
+            "ok": self.ok,
+            "source_ocr_doc_ledger_relpath": self.source_ocr_doc_ledger_relpath,
+            "pages": [p.to_dict(copy=copy) for p in self.pages],
+            "errors": [e.to_dict(copy=copy) for e in self.errors],
+            "meta": deepcopy(self.meta) if copy else self.meta,
+        }
 
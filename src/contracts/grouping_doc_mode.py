@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from copy import deepcopy
+from dataclasses import dataclass
 from typing import Any
 
+from .ocr import BBox, make_bbox
+
 
 @dataclass(frozen=True, slots=True)
 class GroupError:
@@ -10,13 +13,16 @@ class GroupError:
     message: str
     detail: dict[str, Any] | None = None
 
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
+        # `detail` may nest dicts/lists, so the copy is deep (as dataclasses.asdict was).
+        detail = deepcopy(self.detail) if copy and self.detail is not None else self.detail
+        return {"code": self.code, "message": self.message, "detail": detail}
 
-@dataclass(frozen=True, slots=True)
-class GroupBBox:
-    x0: int
-    y0: int
-    x1: int
-    y1: int
+
+# Same fields as the canonical contract bbox; sharing the type gives Stage 2 the cached
+# geometry (area/width/height). Serializes identically (x0, y0, x1, y1).
+GroupBBox = BBox
+make_group_bbox = make_bbox  # positional, int-only fast constructor for hot loops
 
 
 @dataclass(frozen=True, slots=True)
@@ -26,6 +32,34 @@ class GroupTokenRef:
     bbox: GroupBBox
     confidence: float | None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "token_id": self.token_id,
+            "text": self.text,
+            "bbox": self.bbox.to_dict(),
+            "confidence": self.confidence,
+        }
+
+
+_new_object = object.__new__
+_set_token_id, _set_text, _set_bbox, _set_confidence = (
+    GroupTokenRef.__dict__[name].__set__ for name in GroupTokenRef.__slots__
+)
+
+
+def make_group_token_ref(token_id: str, text: str, bbox: GroupBBox, confidence: float | None) -> GroupTokenRef:
+    """
+    Build a `GroupTokenRef` by filling its slots directly, skipping the frozen dataclass
+    `__init__` (four `object.__setattr__` calls; about 2.5x faster). Positional, for the
+    per-token loops in Stage 2; equal to `GroupTokenRef(...)` with the same values.
+    """
+    t = _new_object(GroupTokenRef)
+    _set_token_id(t, token_id)
+    _set_text(t, text)
+    _set_bbox(t, bbox)
+    _set_confidence(t, confidence)
+    return t
+
 
 @dataclass(frozen=True, slots=True)
 class GroupLine:
@@ -35,6 +69,15 @@ class GroupLine:
     tokens: list[GroupTokenRef]
     text: str  # tokens joined with single spaces
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "line_id": self.line_id,
+            "page_num": self.page_num,
+            "bbox": self.bbox.to_dict(),
+            "tokens": [t.to_dict() for t in self.tokens],
+            "text": self.text,
+        }
+
 
 @dataclass(frozen=True, slots=True)
 class GroupBlock:
@@ -44,6 +87,15 @@ class GroupBlock:
     line_ids: list[str]
     text: str  # lines joined with "\n"
 
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
+        return {
+            "block_id": self.block_id,
+            "page_num": self.page_num,
+            "bbox": self.bbox.to_dict(),
+            "line_ids": list(self.line_ids) if copy else self.line_ids,
+            "text": self.text,
+        }
+
 
 @dataclass(frozen=True, slots=True)
 class GroupPageResult:
@@ -55,6 +107,16 @@ class GroupPageResult:
     errors: list[GroupError]
     meta: dict[str, Any]
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
-
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
+        # Hand-rolled (not dataclasses.asdict): no per-instance field reflection. With copy=True
+        # the result shares nothing mutable with this object (meta nests dicts/lists, so it is
+        # deep-copied); copy=False shares line_ids/meta/detail and is meant for serializers.
+        return {
+            "ok": self.ok,
+            "page_num": self.page_num,
+            "source_ocr_relpath": self.source_ocr_relpath,
+            "lines": [l.to_dict() for l in self.lines],
+            "blocks": [b.to_dict(copy=copy) for b in self.blocks],
+            "errors": [e.to_dict(copy=copy) for e in self.errors],
+            "meta": deepcopy(self.meta) if copy else self.meta,
+        }
@@ -18,18 +18,25 @@ class EvidenceRef:
     """
 
     page_num: int
-    token_ids: list[str] | None = None
-    line_ids: list[str] | None = None
-    block_ids: list[str] | None = None
+    token_ids: tuple[str, ...] | None = None
+    line_ids: tuple[str, ...] | None = None
+    block_ids: tuple[str, ...] | None = None
     region_id: str | None = None
     pass_id: str | None = None
 
-    def to_dict(self) -> dict[str, Any]:
+    def __post_init__(self) -> None:
+        # Id sequences are stored as tuples (None stays None), whatever the caller passed.
+        for name in ("token_ids", "line_ids", "block_ids"):
+            ids = getattr(self, name)
+            if ids is not None and type(ids) is not tuple:
+                object.__setattr__(self, name, tuple(ids))
+
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
         return {
             "page_num": self.page_num,
-            "token_ids": None if self.token_ids is None else list(self.token_ids),
-            "line_ids": None if self.line_ids is None else list(self.line_ids),
-            "block_ids": None if self.block_ids is None else list(self.block_ids),
+            "token_ids": list(self.token_ids) if copy and self.token_ids is not None else self.token_ids,
+            "line_ids": list(self.line_ids) if copy and self.line_ids is not None else self.line_ids,
+            "block_ids": list(self.block_ids) if copy and self.block_ids is not None else self.block_ids,
             "region_id": self.region_id,
             "pass_id": self.pass_id,
         }
@@ -43,8 +50,8 @@ class InterpretedField(Generic[T]):
     value: T | None
     evidence: list[EvidenceRef]
 
-    def to_dict(self) -> dict[str, Any]:
-        return {"value": self.value, "evidence": [e.to_dict() for e in self.evidence]}
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
+        return {"value": self.value, "evidence": [e.to_dict(copy=copy) for e in self.evidence]}
 
 
 @dataclass(frozen=True, slots=True)
@@ -54,11 +61,11 @@ class InterpretationResult:
     pass_id: str
     data: dict[str, Any]  # schema-first object; opaque here
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
         return {
             "ok": self.ok,
-            "errors": list(self.errors),
+            "errors": list(self.errors) if copy else self.errors,
             "pass_id": self.pass_id,
-            "data": dict(self.data),
+            "data": dict(self.data) if copy else self.data,
         }
 
@@ -1,26 +1,47 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
 
-@dataclass(frozen=True, slots=True)
+from ._codegen import generated_from_dict
+
+
+@generated_from_dict()
+@dataclass(frozen=True)
 class BBox:
+    # Hand-written __slots__ (not `slots=True`): the cached geometry slots stay out of
+    # dataclasses.fields()/asdict()/eq/repr while BBox remains frozen and dict-free.
+    __slots__ = ("x0", "y0", "x1", "y1", "_w", "_h", "_area")
+
     x0: int
     y0: int
     x1: int
     y1: int
 
+    def __post_init__(self) -> None:
+        # Frozen => geometry is a pure function of the fields; compute it once.
+        w = int(self.x1 - self.x0)
+        h = int(self.y1 - self.y0)
+        object.__setattr__(self, "_w", w)
+        object.__setattr__(self, "_h", h)
+        object.__setattr__(self, "_area", w * h if w > 0 and h > 0 else 0)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Frozen + hand-written slots: default slot-state restore would hit __setattr__.
+        return (BBox, (self.x0, self.y0, self.x1, self.y1))
+
     def width(self) -> int:
-        return int(self.x1 - self.x0)
+        return self._w
 
     def height(self) -> int:
-        return int(self.y1 - self.y0)
+        return self._h
 
     def area(self) -> int:
-        w = self.width()
-        h = self.height()
-        return int(w * h) if w > 0 and h > 0 else 0
+        return self._area
 
     def union(self, other: "BBox") -> "BBox":
         return BBox(
@@ -34,26 +55,52 @@ class BBox:
         return not (self.x1 <= other.x0 or other.x1 <= self.x0 or self.y1 <= other.y0 or other.y1 <= self.y0)
 
     def iou(self, other: "BBox") -> float:
-        if not self.intersects(other):
+        # Disjointness test inlined (no intersects() call) and min/max builtins replaced by
+        # conditional expressions: most pairs in a pairwise sweep exit on the first compare.
+        if self.x1 <= other.x0 or other.x1 <= self.x0 or self.y1 <= other.y0 or other.y1 <= self.y0:
             return 0.0
-        ix0 = max(self.x0, other.x0)
-        iy0 = max(self.y0, other.y0)
-        ix1 = min(self.x1, other.x1)
-        iy1 = min(self.y1, other.y1)
-        iw = max(0, ix1 - ix0)
-        ih = max(0, iy1 - iy0)
-        inter = iw * ih
-        union = self.area() + other.area() - inter
+        ix0 = self.x0 if self.x0 > other.x0 else other.x0
+        iy0 = self.y0 if self.y0 > other.y0 else other.y0
+        ix1 = self.x1 if self.x1 < other.x1 else other.x1
+        iy1 = self.y1 if self.y1 < other.y1 else other.y1
+        iw = ix1 - ix0
+        ih = iy1 - iy0
+        inter = (iw if iw > 0 else 0) * (ih if ih > 0 else 0)
+        union = self._area + other._area - inter
         return float(inter / union) if union > 0 else 0.0
 
-    @staticmethod
-    def from_dict(d: dict[str, Any]) -> "BBox":
-        return BBox(x0=int(d["x0"]), y0=int(d["y0"]), x1=int(d["x1"]), y1=int(d["y1"]))
-
     def to_dict(self) -> dict[str, Any]:
         return {"x0": self.x0, "y0": self.y0, "x1": self.x1, "y1": self.y1}
 
 
+_new_object = object.__new__
+_set_x0, _set_y0, _set_x1, _set_y1, _set_w, _set_h, _set_area = (
+    BBox.__dict__[name].__set__ for name in BBox.__slots__
+)
+
+
+def make_bbox(x0: int, y0: int, x1: int, y1: int) -> BBox:
+    """
+    Build a `BBox` from already-`int` coordinates without running the dataclass `__init__`.
+
+    Fills the slots directly: no frozen `object.__setattr__` per field and no `__post_init__`
+    call (about 2x faster). The result compares, hashes and serializes like `BBox(...)`.
+    Hot-loop constructor; no coercion, so callers must pass ints.
+    """
+    b = _new_object(BBox)
+    _set_x0(b, x0)
+    _set_y0(b, y0)
+    _set_x1(b, x1)
+    _set_y1(b, y1)
+    w = x1 - x0
+    h = y1 - y0
+    _set_w(b, w)
+    _set_h(b, h)
+    _set_area(b, w * h if w > 0 and h > 0 else 0)
+    return b
+
+
+@generated_from_dict(defaults={"text": ""}, interned=("token_id",))
 @dataclass(frozen=True, slots=True)
 class OCRToken:
     token_id: str
@@ -63,17 +110,6 @@ class OCRToken:
     confidence: float | None  # Stage 1 contract: 0..1; allow None for compatibility
     raw_confidence: float | None
 
-    @staticmethod
-    def from_dict(d: dict[str, Any]) -> "OCRToken":
-        return OCRToken(
-            token_id=str(d["token_id"]),
-            page_num=int(d["page_num"]),
-            text=str(d.get("text", "")),
-            bbox=BBox.from_dict(d["bbox"]),
-            confidence=(None if d.get("confidence") is None else float(d.get("confidence"))),
-            raw_confidence=(None if d.get("raw_confidence") is None else float(d.get("raw_confidence"))),
-        )
-
     def to_dict(self) -> dict[str, Any]:
         return {
             "token_id": self.token_id,
@@ -85,22 +121,46 @@ class OCRToken:
         }
 
 
+@generated_from_dict(checked_lists={"tokens": "OCRPage.tokens must be a list"})
 @dataclass(frozen=True, slots=True)
 class OCRPage:
     page_num: int
-    tokens: list[OCRToken]
+    tokens: tuple[OCRToken, ...]
 
-    @staticmethod
-    def from_dict(d: dict[str, Any]) -> "OCRPage":
-        tokens_raw = d.get("tokens") or []
-        if not isinstance(tokens_raw, list):
-            raise TypeError("OCRPage.tokens must be a list")
-        return OCRPage(page_num=int(d["page_num"]), tokens=[OCRToken.from_dict(t) for t in tokens_raw])
+    def __post_init__(self) -> None:
+        # A list from the caller is stored as a tuple, matching `from_dict`.
+        if type(self.tokens) is not tuple:
+            object.__setattr__(self, "tokens", tuple(self.tokens))
 
     def to_dict(self) -> dict[str, Any]:
         return {"page_num": self.page_num, "tokens": [t.to_dict() for t in self.tokens]}
 
 
+def _ocr_errors_from_raw(raw: Any) -> list[str]:
+    # Compatibility: Stage 1 artifacts may emit `errors` as list[object] (e.g., {code,...}).
+    # Canonical contract here uses list[str] and preserves stable identifiers without inventing structure.
+    errors_raw = raw or []
+    if not isinstance(errors_raw, list):
+        raise TypeError("OCRResult.errors must be a list")
+
+    errors: list[str] = []
+    for e in errors_raw:
+        if isinstance(e, str):
+            errors.append(e)
+        elif isinstance(e, dict):
+            if "code" not in e:
+                raise TypeError("OCRResult.errors dict entries must include 'code'")
+            errors.append(str(e["code"]))
+        else:
+            raise TypeError("OCRResult.errors entries must be str or dict-with-code")
+    return errors
+
+
+@generated_from_dict(
+    defaults={"engine": ""},
+    converters={"errors": _ocr_errors_from_raw},
+    checked_lists={"pages": "OCRResult.pages must be a list"},
+)
 @dataclass(frozen=True, slots=True)
 class OCRResult:
     engine: str
@@ -111,45 +171,12 @@ class OCRResult:
     source_image_relpath: str | None
     doc_id: str | None = None
 
-    @staticmethod
-    def from_dict(d: dict[str, Any]) -> "OCRResult":
-        pages_raw = d.get("pages") or []
-        if not isinstance(pages_raw, list):
-            raise TypeError("OCRResult.pages must be a list")
-
-        # Compatibility: Stage 1 artifacts may emit `errors` as list[object] (e.g., {code,...}).
-        # Canonical contract here uses list[str] and preserves stable identifiers without inventing structure.
-        errors_raw = d.get("errors") or []
-        if not isinstance(errors_raw, list):
-            raise TypeError("OCRResult.errors must be a list")
-
-        errors: list[str] = []
-        for e in errors_raw:
-            if isinstance(e, str):
-                errors.append(e)
-            elif isinstance(e, dict):
-                if "code" not in e:
-                    raise TypeError("OCRResult.errors dict entries must include 'code'")
-                errors.append(str(e["code"]))
-            else:
-                raise TypeError("OCRResult.errors entries must be str or dict-with-code")
-
-        return OCRResult(
-            engine=str(d.get("engine", "")),
-            ok=bool(d.get("ok", False)),
-            errors=errors,
-            meta=dict(d.get("meta") or {}),
-            pages=[OCRPage.from_dict(p) for p in pages_raw],
-            source_image_relpath=(None if d.get("source_image_relpath") is None else str(d.get("source_image_relpath"))),
-            doc_id=(None if d.get("doc_id") is None else str(d.get("doc_id"))),
-        )
-
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, *, copy: bool = True) -> dict[str, Any]:
         out: dict[str, Any] = {
             "engine": self.engine,
             "ok": self.ok,
-            "errors": list(self.errors),
-            "meta": dict(self.meta),
+            "errors": list(self.errors) if copy else self.errors,
+            "meta": dict(self.meta) if copy else self.meta,
             "pages": [p.to_dict() for p in self.pages],
             "source_image_relpath": self.source_image_relpath,
         }
@@ -157,3 +184,100 @@ class OCRResult:
             out["doc_id"] = self.doc_id
         return out
 
+    @staticmethod
+    def from_path(path: Path) -> "OCRResult":
+        """
+        Load a Stage 1 OCR artifact from disk.
+
+        With `ijson` installed the file is streamed: each token object becomes an `OCRToken`
+        as soon as it is parsed, so the full JSON tree never sits in memory next to the
+        dataclasses. Without it, falls back to `json.load` + `from_dict`. Both paths coerce
+        and validate like `from_dict`.
+        """
+
+        try:
+            import ijson  # type: ignore
+        except ImportError:
+            import json
+
+            with open(path, encoding="utf-8") as f:
+                return OCRResult.from_dict(json.load(f))
+
+        with open(path, "rb") as f:
+            return _ocr_result_from_events(ijson.parse(f, use_float=True), ijson.ObjectBuilder)
+
+
+def _ocr_result_from_events(events: Iterable[tuple[str, str, Any]], builder_cls: type) -> OCRResult:
+    # Only `pages[].tokens[]` is streamed into dataclasses; every other value is built as plain
+    # JSON and handed to the regular from_dict so errors and coercion stay identical.
+    top: dict[str, Any] = {}
+    pages: list[OCRPage] | None = None
+    page: dict[str, Any] = {}
+    tokens: list[OCRToken] | None = None
+    top_key = page_key = ""
+
+    builder: Any = None
+    depth = 0
+    sink: Callable[[Any], None] = top.update
+
+    for prefix, event, value in events:
+        if builder is not None:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            if depth == 0:
+                sink(builder.value)
+                builder = None
+            continue
+
+        if event == "map_key":
+            if prefix == "":
+                top_key = value
+            elif prefix == "pages.item":
+                page_key = value
+            continue
+        if prefix == "" and event in ("start_map", "end_map"):
+            continue
+        if prefix == "pages" and top_key == "pages" and event in ("start_array", "end_array"):
+            if event == "start_array":
+                pages = []
+            continue
+        if prefix == "pages.item" and pages is not None and event in ("start_map", "end_map"):
+            if event == "start_map":
+                page, tokens = {}, None
+            elif tokens is None:
+                pages.append(OCRPage.from_dict(page))
+            else:
+                pages.append(OCRPage(page_num=int(page["page_num"]), tokens=tuple(tokens)))
+            continue
+        if prefix == "pages.item.tokens" and page_key == "tokens" and event in ("start_array", "end_array"):
+            if event == "start_array":
+                tokens = []
+            continue
+
+        # Start of a value that is built generically, then routed by `sink`.
+        if prefix == "pages.item.tokens.item" and tokens is not None:
+            sink = lambda v, _out=tokens: _out.append(OCRToken.from_dict(v))
+        elif prefix == "pages.item" and pages is not None:
+            sink = lambda v, _out=pages: _out.append(OCRPage.from_dict(v))
+        elif prefix.startswith("pages.item.") and pages is not None:
+            sink = lambda v, _page=page, _k=page_key: _page.__setitem__(_k, v)
+        elif prefix == "":
+            sink = lambda v: top.__setitem__("", v)
+        else:
+            sink = lambda v, _k=top_key: top.__setitem__(_k, v)
+
+        builder = builder_cls()
+        builder.event(event, value)
+        depth = 1 if event in ("start_map", "start_array") else 0
+        if depth == 0:
+            sink(builder.value)
+            builder = None
+
+    if "" in top:  # document root is not an object
+        return OCRResult.from_dict(top[""])
+    res = OCRResult.from_dict(top)
+    return res if pages is None else replace(res, pages=pages)
+
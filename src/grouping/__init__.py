@@ -9,7 +9,14 @@ Implements Stage 2 contract in docs/architecture:
 No semantic interpretation, no OCR correction, no ML.
 """
 
-from .doc_module import run_group_on_ocr_doc_ledger
-
 __all__ = ["run_group_on_ocr_doc_ledger"]
 
+
+def __getattr__(name: str):
+    # Loaded on first use so `sq-grouping --help` does not import the grouping engine.
+    if name == "run_group_on_ocr_doc_ledger":
+        from .doc_module import run_group_on_ocr_doc_ledger
+
+        return run_group_on_ocr_doc_ledger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
@@ -1,21 +1,79 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from concurrent.futures import Future
 
 from contracts.grouping_doc_mode import GroupPageResult
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+else:
+    # OPT_NON_STR_KEYS: int/float/bool keys in `meta`/`detail` stringify like stdlib json
+    # instead of raising TypeError. OPT_APPEND_NEWLINE: the trailing newline comes out of the
+    # encoder's own buffer (no `bytes + b"\n"` copy, one write() per file).
+    _ORJSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+
+
+def _group_page_result_bytes(result: GroupPageResult) -> bytes:
+    # No key sorting: dataclass fields serialize in declaration order and every dict in the
+    # payload is built with a fixed key sequence, so insertion order is already deterministic.
+    # Both backends write the same layout (indent 2, `"key": value`) and the same content.
+    # Finite floats in exponent form are spelled differently (stdlib `1e-05`, orjson `0.00001`),
+    # so artifact bytes can depend on whether the fast extra is installed. Non-finite floats
+    # have no JSON spelling: orjson writes `null`, and the stdlib path refuses them
+    # (allow_nan=False) instead of emitting a bare `NaN`.
+    payload: dict[str, Any] = result.to_dict(copy=False)  # only read by the encoder
+    if orjson is not None:
+        # Fed the hand-rolled to_dict(), not the dataclass: orjson serializes slotted
+        # dataclasses through a slow attribute path (~1.8x slower on a 20k-token page).
+        return orjson.dumps(payload, option=_ORJSON_OPTS)
+    return (json.dumps(payload, ensure_ascii=False, indent=2, allow_nan=False) + "\n").encode("utf-8")
+
 
 def serialize_group_page_result(result: GroupPageResult) -> str:
-    payload: dict[str, Any] = result.to_dict()
-    return (
-        json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"), indent=2)
-        + "\n"
-    )
+    return _group_page_result_bytes(result).decode("utf-8")
 
 
 def write_group_json_artifact(*, result: GroupPageResult, out_file: Path) -> None:
     out_file.parent.mkdir(parents=True, exist_ok=True)
-    out_file.write_text(serialize_group_page_result(result), encoding="utf-8")
+    # Serialized completely before the file is opened: a payload the encoder rejects
+    # leaves no truncated artifact behind.
+    data = _group_page_result_bytes(result)
+    with open(out_file, "wb") as f:
+        f.write(data)
+
+
+def write_group_json_artifacts_batch(
+    results: Iterable[tuple[GroupPageResult, Path]], *, max_workers: int = 2
+) -> None:
+    """
+    Write several page artifacts on writer threads while `results` is still being produced.
+
+    `results` is consumed lazily: a generator that groups pages keeps grouping while earlier
+    pages are serialized and written, and at most `2 * max_workers` results wait in the queue
+    (finished pages are not all held until the end). Each file is written exactly as
+    `write_group_json_artifact` would. The first failing write is re-raised after all
+    submitted writes have finished.
+    """
 
+    if max_workers <= 1:
+        for result, out_file in results:
+            write_group_json_artifact(result=result, out_file=out_file)
+        return
+    window = 2 * max_workers
+    futures: list[Future[None]] = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for result, out_file in results:
+            if len(futures) >= window:
+                wait([futures[-window]])
+            futures.append(executor.submit(write_group_json_artifact, result=result, out_file=out_file))
+    for fut in futures:
+        fut.result()
@@ -4,7 +4,6 @@ import argparse
 from pathlib import Path
 
 from .config_doc import GroupingConfigDoc
-from .doc_module import run_group_on_ocr_doc_ledger
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -58,11 +57,25 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default=False,
         help='Omit line.text and block.text fields (default: include).',
     )
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for grouping pages (default 1: group in-process; 0: one per CPU).",
+    )
     return p
 
 
+_PARSER = build_arg_parser()
+
+
 def main(argv: list[str] | None = None) -> int:
-    args = build_arg_parser().parse_args(argv)
+    args = _PARSER.parse_args(argv)
+
+    # Deferred until argv is valid: `--help` and usage errors exit above without
+    # importing the grouping engine and its contracts.
+    from .doc_module import run_group_on_ocr_doc_ledger
+
     cfg = GroupingConfigDoc(
         confidence_floor=args.confidence_floor,
         drop_whitespace_tokens=(not args.keep_whitespace_tokens),
@@ -80,6 +93,7 @@ def main(argv: list[str] | None = None) -> int:
         out_dir=args.out_dir,
         out_doc_manifest=args.out_doc,
         config=cfg,
+        jobs=args.jobs,
     )
     print(f"doc_id={result.doc_id or '<missing>'} pages={len(result.pages)} ok={result.ok}")
     return 0 if result.ok else 2
@@ -6,16 +6,32 @@ from typing import Any
 
 from contracts.grouping_doc import GroupDocResult
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+else:
+    # OPT_NON_STR_KEYS: int/float/bool keys in `meta`/`detail` stringify like stdlib json
+    # instead of raising TypeError. OPT_APPEND_NEWLINE as in grouping.artifacts.
+    _ORJSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+
+
+def _group_doc_result_bytes(result: GroupDocResult) -> bytes:
+    # Same layout and backend caveats as the per-page artifacts (grouping.artifacts):
+    # declaration order, indent 2, non-finite floats refused on the stdlib path.
+    payload: dict[str, Any] = result.to_dict(copy=False)  # only read by the encoder
+    if orjson is not None:
+        return orjson.dumps(payload, option=_ORJSON_OPTS)
+    return (json.dumps(payload, ensure_ascii=False, indent=2, allow_nan=False) + "\n").encode("utf-8")
+
 
 def serialize_group_doc_result(result: GroupDocResult) -> str:
-    payload: dict[str, Any] = result.to_dict()
-    return (
-        json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"), indent=2)
-        + "\n"
-    )
+    return _group_doc_result_bytes(result).decode("utf-8")
 
 
 def write_group_doc_manifest_json(*, result: GroupDocResult, out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(serialize_group_doc_result(result), encoding="utf-8")
-
+    # Serialized before opening, as in grouping.artifacts.write_group_json_artifact.
+    data = _group_doc_result_bytes(result)
+    with open(out_path, "wb") as f:
+        f.write(data)
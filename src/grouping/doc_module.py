@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+import functools
+import io
 import json
+import math
+import os
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from json.encoder import encode_basestring as _json_str
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from .artifacts import write_group_json_artifact
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from concurrent.futures import Future
+
+from .artifacts import write_group_json_artifact, write_group_json_artifacts_batch
 from .config_doc import GroupingConfigDoc
 from .doc_artifacts import write_group_doc_manifest_json
 from contracts.grouping_doc_mode import (
@@ -14,9 +26,16 @@ from contracts.grouping_doc_mode import (
     GroupLine,
     GroupPageResult,
     GroupTokenRef,
+    make_group_bbox,
+    make_group_token_ref,
 )
 from contracts.grouping_doc import GroupDocPageRef, GroupDocResult
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2].resolve()
@@ -25,11 +44,31 @@ def _repo_root() -> Path:
 _GROUPING_ALGORITHM = "lines_blocks"
 _GROUPING_VERSION = "lines_blocks_v1"
 
+# In-process runs: OCR page files read ahead of the page being grouped.
+_READ_AHEAD_PAGES = 4
+
 
 def _stable_json(x: Any) -> str:
     return json.dumps(x, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
 
+def _load_json(path: Path, data: bytes | None = None) -> Any:
+    # orjson parses the raw bytes (no str decode). Anything it rejects is re-parsed with the
+    # stdlib, so inputs only json accepts (NaN, lone surrogates) and the repr(e) recorded in
+    # *_INVALID_JSON errors stay the same with or without the optional extra. One difference
+    # remains: integers outside the 64-bit range come back from orjson as floats.
+    # `data` is the file's content when it was already read (see _read_ahead_ocr_bytes).
+    if data is None:
+        data = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    # Decoded like Path.read_text(encoding="utf-8"), newline translation included.
+    return json.loads(io.TextIOWrapper(io.BytesIO(data), encoding="utf-8").read())
+
+
 def _params_dict(cfg: GroupingConfigDoc) -> dict[str, Any]:
     return {
         "confidence_floor": cfg.confidence_floor,
@@ -61,7 +100,7 @@ def _zero_derived(cfg: GroupingConfigDoc) -> dict[str, Any]:
 
 def _page_meta(
     *,
-    cfg: GroupingConfigDoc,
+    params: dict[str, Any],
     derived: dict[str, Any],
     tokens_in: int,
     tokens_used: int,
@@ -71,13 +110,14 @@ def _page_meta(
     warnings: list[dict[str, Any]],
 ) -> dict[str, Any]:
     # Ensure schema consistency across success/failure paths.
+    # `params`/`derived` are shared, not copied: page metas are only serialized, never mutated.
     return {
         "stage": 2,
         "mode": "page",
         "algorithm": _GROUPING_ALGORITHM,
         "version": _GROUPING_VERSION,
-        "params": _params_dict(cfg),
-        "derived": dict(derived),
+        "params": params,
+        "derived": derived,
         "counts": {
             "tokens_in": int(tokens_in),
             "tokens_used": int(tokens_used),
@@ -91,26 +131,64 @@ def _page_meta(
     }
 
 
+# Above this many values _median_int counts instead of sorting (measured crossover ~450).
+_MEDIAN_COUNT_MIN = 512
+
+
 def _median_int(values: list[int]) -> int:
     if not values:
         return 1
-    s = sorted(values)
-    n = len(s)
+    n = len(values)
     mid = n // 2
-    if n % 2 == 1:
-        return int(s[mid])
-    return int((s[mid - 1] + s[mid]) // 2)
+    if n < _MEDIAN_COUNT_MIN:
+        s = sorted(values)
+        if n % 2 == 1:
+            return int(s[mid])
+        return int((s[mid - 1] + s[mid]) // 2)
+
+    # Pixel heights/gaps repeat heavily: select the middle rank(s) from a histogram, which
+    # sorts only the distinct values instead of the whole list.
+    counts = Counter(values)
+    seen = 0
+    lo: int | None = None
+    for v in sorted(counts):
+        seen += counts[v]
+        if lo is None and seen >= mid:
+            lo = v
+        if seen > mid:
+            return int(v) if n % 2 == 1 else int((lo + v) // 2)
+    raise AssertionError("unreachable")
 
 
 def _bbox_from_dict(d: dict[str, Any]) -> GroupBBox | None:
     try:
-        return GroupBBox(x0=int(d["x0"]), y0=int(d["y0"]), x1=int(d["x1"]), y1=int(d["y1"]))
+        return make_group_bbox(int(d["x0"]), int(d["y0"]), int(d["x1"]), int(d["y1"]))
     except Exception:
         return None
 
 
+def _enclosing_bbox(items: list[GroupTokenRef] | list[GroupLine]) -> GroupBBox:
+    # One pass over the items' boxes instead of four min()/max() generator scans, reading
+    # `.bbox` directly (no intermediate list of boxes) and skipping the seed item.
+    it = iter(items)
+    first = next(it).bbox
+    x0, y0, x1, y1 = first.x0, first.y0, first.x1, first.y1
+    for item in it:
+        b = item.bbox
+        if b.x0 < x0:
+            x0 = b.x0
+        if b.y0 < y0:
+            y0 = b.y0
+        if b.x1 > x1:
+            x1 = b.x1
+        if b.y1 > y1:
+            y1 = b.y1
+    return make_group_bbox(x0, y0, x1, y1)
+
+
 def _compute_line_y_tol_px(*, cfg: GroupingConfigDoc, median_token_height_px: int) -> int:
-    return max(int(cfg.min_line_y_tol_px), int(max(0, cfg.line_y_tol_k) * int(median_token_height_px)))
+    # The outer int() truncates the float k * height product; the median is already an int.
+    return max(int(cfg.min_line_y_tol_px), int(max(0, cfg.line_y_tol_k) * median_token_height_px))
 
 
 def group_tokens_into_lines(
@@ -130,56 +208,68 @@ def group_tokens_into_lines(
     line_y_tol = _compute_line_y_tol_px(cfg=cfg, median_token_height_px=h_med)
 
     # Each line keeps a reference y0 from its first token.
+    # Tokens arrive in y0 order and a bin is only opened for a token more than the tolerance
+    # below the newest bin's reference, so no older bin can match later tokens: comparing
+    # against the newest bin gives the same first-match result as scanning all of them.
+    # Coordinates are ints by contract (the OCR loader coerces them), so no int() per token.
+    # The open bin's reference and token list live in locals, and since y0 never decreases
+    # along the sweep, `y0 - ref_y0` is already the absolute distance (no abs() call).
     line_bins: list[dict[str, Any]] = []
+    ref_y0 = 0
+    open_tokens: list[GroupTokenRef] | None = None
     for t in tokens_sorted:
-        placed = False
-        for lb in line_bins:
-            if abs(int(t.bbox.y0) - int(lb["ref_y0"])) <= line_y_tol:
-                lb["tokens"].append(t)
-                placed = True
-                break
-        if not placed:
-            line_bins.append({"ref_y0": int(t.bbox.y0), "tokens": [t]})
+        y0 = t.bbox.y0
+        if open_tokens is not None and y0 - ref_y0 <= line_y_tol:
+            open_tokens.append(t)
+        else:
+            ref_y0 = y0
+            open_tokens = [t]
+            line_bins.append({"ref_y0": y0, "tokens": open_tokens})
 
     # Refinement pass: deterministically split bins that captured multiple baselines.
     refined_bins: list[dict[str, Any]] = []
     for lb in line_bins:
-        bin_tokens = sorted(lb["tokens"], key=lambda t: (t.bbox.x0, t.token_id))
+        # Bins are filled in tokens_sorted order, so each is already sorted by
+        # (y0, x0, token_id), and the median does not depend on order: no re-sorting needed.
+        bin_tokens = lb["tokens"]
         bin_heights = [max(1, t.bbox.y1 - t.bbox.y0) for t in bin_tokens]
         bin_h_med = _median_int(bin_heights)
         bin_tol = _compute_line_y_tol_px(cfg=cfg, median_token_height_px=bin_h_med)
 
+        # Same y0-ordered sweep as above: only the newest sub-bin can take the next token.
         subbins: list[dict[str, Any]] = []
-        for t in sorted(bin_tokens, key=lambda t: (t.bbox.y0, t.bbox.x0, t.token_id)):
-            placed = False
-            for sb in subbins:
-                if abs(int(t.bbox.y0) - int(sb["ref_y0"])) <= bin_tol:
-                    sb["tokens"].append(t)
-                    placed = True
-                    break
-            if not placed:
-                subbins.append({"ref_y0": int(t.bbox.y0), "tokens": [t]})
+        sub_ref_y0 = 0
+        sub_tokens: list[GroupTokenRef] | None = None
+        for t in bin_tokens:
+            y0 = t.bbox.y0
+            if sub_tokens is not None and y0 - sub_ref_y0 <= bin_tol:
+                sub_tokens.append(t)
+            else:
+                sub_ref_y0 = y0
+                sub_tokens = [t]
+                subbins.append({"ref_y0": y0, "tokens": sub_tokens})
 
         refined_bins.extend(subbins)
 
     # Build line records without IDs, then sort and assign IDs in that sorted order.
+    # Text is decided once per call; with it off no token text is touched here. join() gets
+    # a list comprehension: it materializes a generator into a list first anyway.
+    include_text = cfg.include_text_fields
     line_recs: list[dict[str, Any]] = []
     for lb in refined_bins:
         line_tokens: list[GroupTokenRef] = sorted(lb["tokens"], key=lambda t: (t.bbox.x0, t.token_id))
-        x0 = min(t.bbox.x0 for t in line_tokens)
-        y0 = min(t.bbox.y0 for t in line_tokens)
-        x1 = max(t.bbox.x1 for t in line_tokens)
-        y1 = max(t.bbox.y1 for t in line_tokens)
-        bbox = GroupBBox(x0=x0, y0=y0, x1=x1, y1=y1)
-        text = "" if not cfg.include_text_fields else " ".join(t.text for t in line_tokens)
+        bbox = _enclosing_bbox(line_tokens)
+        text = " ".join([t.text for t in line_tokens]) if include_text else ""
         first_token_id = line_tokens[0].token_id if line_tokens else ""
         line_recs.append({"bbox": bbox, "tokens": line_tokens, "text": text, "tiebreak": first_token_id})
 
     line_recs.sort(key=lambda r: (r["bbox"].y0, r["bbox"].x0, r["tiebreak"]))
 
     lines: list[GroupLine] = []
+    # The page part of the id is formatted once per page, not once per line.
+    line_id_prefix = f"p{page_num:03d}_l"
     for i, r in enumerate(line_recs):
-        line_id = f"p{page_num:03d}_l{i:04d}"
+        line_id = f"{line_id_prefix}{i:04d}"
         lines.append(
             GroupLine(
                 line_id=line_id,
@@ -194,10 +284,12 @@ def group_tokens_into_lines(
 
 
 def _h_overlap_ratio(a: GroupBBox, b: GroupBBox) -> float:
-    w_a = max(1, a.x1 - a.x0)
-    w_b = max(1, b.x1 - b.x0)
-    overlap = max(0, min(a.x1, b.x1) - max(a.x0, b.x0))
-    return float(overlap) / float(min(w_a, w_b))
+    # Conditional expressions instead of min()/max() builtins: called once per line pair.
+    w_a = a.x1 - a.x0
+    w_b = b.x1 - b.x0
+    w = w_a if w_a < w_b else w_b
+    overlap = (a.x1 if a.x1 < b.x1 else b.x1) - (a.x0 if a.x0 > b.x0 else b.x0)
+    return float(overlap if overlap > 0 else 0) / float(w if w > 1 else 1)
 
 
 def group_lines_into_blocks(
@@ -220,42 +312,42 @@ def group_lines_into_blocks(
     heights = [max(1, l.bbox.y1 - l.bbox.y0) for l in lines]
     med_h = _median_int(heights)
 
-    gaps: list[int] = []
-    for prev, cur in zip(lines, lines[1:]):
-        gaps.append(max(0, int(cur.bbox.y0) - int(prev.bbox.y1)))
-    med_gap = _median_int(gaps) if gaps else 0
-
     gap_threshold = max(int(cfg.min_block_gap_px), int(cfg.block_gap_k * med_h))
     overlap_threshold = float(cfg.block_overlap_threshold)
 
+    # Single pass over adjacent line pairs: clamped gaps (for the median) and block breaks.
+    # The overlap ratio is only evaluated when the gap alone does not already force a break.
+    gaps: list[int] = []
     block_bins: list[list[GroupLine]] = []
     current: list[GroupLine] = [lines[0]]
-    for prev, cur in zip(lines, lines[1:]):
-        gap = int(cur.bbox.y0) - int(prev.bbox.y1)
-        overlap = _h_overlap_ratio(prev.bbox, cur.bbox)
-        if gap > gap_threshold or overlap < overlap_threshold:
+    prev_bbox = lines[0].bbox
+    for cur in lines[1:]:
+        bbox = cur.bbox
+        gap = bbox.y0 - prev_bbox.y1
+        gaps.append(gap if gap > 0 else 0)
+        if gap > gap_threshold or _h_overlap_ratio(prev_bbox, bbox) < overlap_threshold:
             block_bins.append(current)
             current = [cur]
         else:
             current.append(cur)
+        prev_bbox = bbox
     block_bins.append(current)
+    med_gap = _median_int(gaps) if gaps else 0
 
+    include_text = cfg.include_text_fields
     block_recs: list[dict[str, Any]] = []
     for b in block_bins:
-        x0 = min(l.bbox.x0 for l in b)
-        y0 = min(l.bbox.y0 for l in b)
-        x1 = max(l.bbox.x1 for l in b)
-        y1 = max(l.bbox.y1 for l in b)
-        bbox = GroupBBox(x0=x0, y0=y0, x1=x1, y1=y1)
+        bbox = _enclosing_bbox(b)
         line_ids = [l.line_id for l in b]
-        text = "" if not cfg.include_text_fields else "\n".join(l.text for l in b)
+        text = "\n".join([l.text for l in b]) if include_text else ""
         block_recs.append({"bbox": bbox, "line_ids": line_ids, "text": text, "tiebreak": line_ids[0]})
 
     block_recs.sort(key=lambda r: (r["bbox"].y0, r["bbox"].x0, r["tiebreak"]))
 
     blocks: list[GroupBlock] = []
+    block_id_prefix = f"p{page_num:03d}_b"
     for i, r in enumerate(block_recs):
-        block_id = f"p{page_num:03d}_b{i:04d}"
+        block_id = f"{block_id_prefix}{i:04d}"
         blocks.append(
             GroupBlock(
                 block_id=block_id,
@@ -279,13 +371,17 @@ def _repair_bbox(*, bbox: GroupBBox) -> GroupBBox:
     x1 = max(bbox.x0, bbox.x1)
     y0 = min(bbox.y0, bbox.y1)
     y1 = max(bbox.y0, bbox.y1)
-    return GroupBBox(x0=x0, y0=y0, x1=x1, y1=y1)
+    return make_group_bbox(x0, y0, x1, y1)
 
 
-def _bbox_area(b: GroupBBox) -> int:
-    w = max(0, b.x1 - b.x0)
-    h = max(0, b.y1 - b.y0)
-    return int(w * h)
+def _repair_warning_sort_key(token_id: str, before: GroupBBox, after: GroupBBox) -> str:
+    # Exactly `_stable_json(detail)` for a GROUP_BBOX_REPAIRED detail (keys sorted, compact,
+    # ensure_ascii=False), built without a json.dumps call per warning.
+    return (
+        f'{{"after":{{"x0":{after.x0},"x1":{after.x1},"y0":{after.y0},"y1":{after.y1}}},'
+        f'"before":{{"x0":{before.x0},"x1":{before.x1},"y0":{before.y0},"y1":{before.y1}}},'
+        f'"token_id":{_json_str(token_id)}}}'
+    )
 
 
 def _preprocess_tokens(
@@ -295,61 +391,421 @@ def _preprocess_tokens(
     Returns: (tokens_used, dropped_tokens, warnings)
     """
 
-    dropped: list[dict[str, Any]] = []
-    warnings: list[dict[str, Any]] = []
+    # Collected as plain tuples whose natural order is the canonical output order; the dicts
+    # are only materialized once, after sorting.
+    dropped: list[tuple[str, str]] = []
+    repaired_raw: list[tuple[str, GroupBBox, GroupBBox]] = []
     used: list[GroupTokenRef] = []
 
+    drop_whitespace = cfg.drop_whitespace_tokens
+    confidence_floor = cfg.confidence_floor
+    check_confidence = confidence_floor > 0.0
+    repair_bboxes = cfg.repair_bboxes
+
     warned_bbox_repair: set[str] = set()
     for t in tokens:
-        if cfg.drop_whitespace_tokens and t.text.strip() == "":
-            dropped.append({"token_id": t.token_id, "reason": "WHITESPACE"})
+        # Same test as `t.text.strip() == ""` without allocating a stripped copy per token.
+        if drop_whitespace and (not t.text or t.text.isspace()):
+            dropped.append((t.token_id, "WHITESPACE"))
             continue
 
-        if cfg.confidence_floor > 0.0 and t.confidence is not None and float(t.confidence) < cfg.confidence_floor:
-            dropped.append({"token_id": t.token_id, "reason": "BELOW_CONFIDENCE_FLOOR"})
+        if check_confidence and t.confidence is not None and float(t.confidence) < confidence_floor:
+            dropped.append((t.token_id, "BELOW_CONFIDENCE_FLOOR"))
             continue
 
         bbox = t.bbox
-        if cfg.repair_bboxes:
+        # Only swapped endpoints need a new bbox; everything else keeps the token as-is
+        # (GroupTokenRef is frozen, so reusing it is indistinguishable from a copy).
+        if repair_bboxes and (bbox.x0 > bbox.x1 or bbox.y0 > bbox.y1):
             repaired = _repair_bbox(bbox=bbox)
-            if repaired != bbox:
-                if t.token_id not in warned_bbox_repair:
-                    warned_bbox_repair.add(t.token_id)
-                    warnings.append(
-                        {
-                            "code": "GROUP_BBOX_REPAIRED",
-                            "message": "Token bbox endpoints were swapped deterministically",
-                            "detail": {
-                                "token_id": t.token_id,
-                                "before": {"x0": bbox.x0, "y0": bbox.y0, "x1": bbox.x1, "y1": bbox.y1},
-                                "after": {
-                                    "x0": repaired.x0,
-                                    "y0": repaired.y0,
-                                    "x1": repaired.x1,
-                                    "y1": repaired.y1,
-                                },
-                            },
-                        }
-                    )
+            if t.token_id not in warned_bbox_repair:
+                warned_bbox_repair.add(t.token_id)
+                repaired_raw.append((t.token_id, bbox, repaired))
             bbox = repaired
+            t = make_group_token_ref(t.token_id, t.text, bbox, t.confidence)
 
-        if _bbox_area(bbox) <= 0:
-            dropped.append({"token_id": t.token_id, "reason": "BBOX_ZERO_AREA"})
+        if bbox.area() <= 0:
+            dropped.append((t.token_id, "BBOX_ZERO_AREA"))
             continue
 
-        used.append(
-            GroupTokenRef(
-                token_id=t.token_id,
-                text=t.text,
-                bbox=bbox,
-                confidence=t.confidence,
-            )
+        used.append(t)
+
+    # Canonicalize deterministically: drops by (token_id, reason); warnings by
+    # (code, message, stable detail JSON), and every warning here shares code and message.
+    # The filter loop only records (token_id, before, after); sort keys and warning dicts are
+    # built here, in one pass each.
+    dropped.sort()
+    repairs = [(_repair_warning_sort_key(tid, before, after), tid, before, after) for tid, before, after in repaired_raw]
+    repairs.sort(key=itemgetter(0))
+    dropped_out = [{"token_id": tid, "reason": reason} for tid, reason in dropped]
+    warnings = [
+        {
+            "code": "GROUP_BBOX_REPAIRED",
+            "message": "Token bbox endpoints were swapped deterministically",
+            "detail": {
+                "token_id": tid,
+                "before": {"x0": before.x0, "y0": before.y0, "x1": before.x1, "y1": before.y1},
+                "after": {"x0": after.x0, "y0": after.y0, "x1": after.x1, "y1": after.y1},
+            },
+        }
+        for _, tid, before, after in repairs
+    ]
+    return used, dropped_out, warnings
+
+
+def _read_ahead_ocr_bytes(repo_root: Path, ocr_out_relpath: str) -> bytes | None:
+    # Reader-thread side of the in-process page loop. Anything unusual (outside the repo
+    # root, missing, unreadable) yields None, and _group_page's own checks then report it
+    # exactly as without read-ahead.
+    ocr_file = (repo_root / ocr_out_relpath).resolve()
+    try:
+        ocr_file.relative_to(repo_root)
+        return ocr_file.read_bytes()
+    except Exception:
+        return None
+
+
+def _group_page(
+    *,
+    page_num: int,
+    ocr_out_relpath: str,
+    repo_root: Path,
+    cfg: GroupingConfigDoc,
+    params: dict[str, Any],
+    zero_derived: dict[str, Any],
+    ocr_bytes: bytes | None = None,
+) -> GroupPageResult:
+    """
+    Group one ledger page. Failures come back as `ok=False` results; nothing is written here.
+
+    `ocr_bytes` is the OCR page file's content if it was already read ahead; otherwise the
+    file is read here.
+    """
+
+    ocr_file = (repo_root / ocr_out_relpath).resolve()
+    try:
+        ocr_file.relative_to(repo_root)
+    except Exception:
+        meta = _page_meta(
+            params=params,
+            derived=zero_derived,
+            tokens_in=0,
+            tokens_used=0,
+            lines=0,
+            blocks=0,
+            dropped_tokens=[],
+            warnings=[],
+        )
+        return GroupPageResult(
+            ok=False,
+            page_num=page_num,
+            source_ocr_relpath=ocr_out_relpath,
+            lines=[],
+            blocks=[],
+            errors=[
+                GroupError(
+                    code="GROUP_OCR_RELPATH_OUTSIDE_REPO",
+                    message="ocr_out_relpath must resolve under repo root",
+                    detail={
+                        "ocr_out_relpath": ocr_out_relpath,
+                        "repo_root": str(repo_root),
+                        "resolved": str(ocr_file),
+                    },
+                )
+            ],
+            meta=meta,
         )
 
-    # Canonicalize deterministically.
-    dropped.sort(key=lambda x: (str(x.get("token_id", "")), str(x.get("reason", ""))))
-    warnings.sort(key=lambda w: (str(w.get("code", "")), str(w.get("message", "")), _stable_json(w.get("detail"))))
-    return used, dropped, warnings
+    if not ocr_file.exists():
+        meta = _page_meta(
+            params=params,
+            derived=zero_derived,
+            tokens_in=0,
+            tokens_used=0,
+            lines=0,
+            blocks=0,
+            dropped_tokens=[],
+            warnings=[],
+        )
+        return GroupPageResult(
+            ok=False,
+            page_num=page_num,
+            source_ocr_relpath=ocr_out_relpath,
+            lines=[],
+            blocks=[],
+            errors=[
+                GroupError(
+                    code="GROUP_SOURCE_OCR_MISSING",
+                    message="Expected OCR page artifact missing on disk",
+                    detail={"ocr_out_relpath": ocr_out_relpath, "resolved": str(ocr_file)},
+                )
+            ],
+            meta=meta,
+        )
+
+    try:
+        ocr_payload = _load_json(ocr_file, ocr_bytes)
+    except Exception as e:
+        meta = _page_meta(
+            params=params,
+            derived=zero_derived,
+            tokens_in=0,
+            tokens_used=0,
+            lines=0,
+            blocks=0,
+            dropped_tokens=[],
+            warnings=[],
+        )
+        return GroupPageResult(
+            ok=False,
+            page_num=page_num,
+            source_ocr_relpath=ocr_out_relpath,
+            lines=[],
+            blocks=[],
+            errors=[
+                GroupError(
+                    code="GROUP_OCR_INVALID_JSON",
+                    message="Failed to parse OCR page JSON",
+                    detail={"ocr_out_relpath": ocr_out_relpath, "error": repr(e)},
+                )
+            ],
+            meta=meta,
+        )
+
+    # Extract tokens from the Stage 1 per-page OCR artifact by matching the ledger page_num.
+    pages = ocr_payload.get("pages")
+    if not isinstance(pages, list):
+        meta = _page_meta(
+            params=params,
+            derived=zero_derived,
+            tokens_in=0,
+            tokens_used=0,
+            lines=0,
+            blocks=0,
+            dropped_tokens=[],
+            warnings=[],
+        )
+        return GroupPageResult(
+            ok=False,
+            page_num=page_num,
+            source_ocr_relpath=ocr_out_relpath,
+            lines=[],
+            blocks=[],
+            errors=[
+                GroupError(
+                    code="GROUP_OCR_BAD_SHAPE",
+                    message="OCR page artifact missing pages[]",
+                    detail={"ocr_out_relpath": ocr_out_relpath},
+                )
+            ],
+            meta=meta,
+        )
+
+    matching_pages: list[dict[str, Any]] = []
+    for pe in pages:
+        if not isinstance(pe, dict):
+            continue
+        if pe.get("page_num") == page_num:
+            matching_pages.append(pe)
+
+    if len(matching_pages) == 0:
+        available = sorted(
+            [
+                int(pe.get("page_num"))
+                for pe in pages
+                if isinstance(pe, dict) and isinstance(pe.get("page_num"), int)
+            ]
+        )
+        meta = _page_meta(
+            params=params,
+            derived=zero_derived,
+            tokens_in=0,
+            tokens_used=0,
+            lines=0,
+            blocks=0,
+            dropped_tokens=[],
+            warnings=[],
+        )
+        return GroupPageResult(
+            ok=False,
+            page_num=page_num,
+            source_ocr_relpath=ocr_out_relpath,
+            lines=[],
+            blocks=[],
+            errors=[
+                GroupError(
+                    code="GROUP_OCR_PAGE_NUM_MISMATCH",
+                    message="OCR page artifact contains no page entry matching ledger page_num",
+                    detail={"ledger_page_num": page_num, "available_page_nums": available},
+                )
+            ],
+            meta=meta,
+        )
+
+    if len(matching_pages) > 1:
+        meta = _page_meta(
+            params=params,
+            derived=zero_derived,
+            tokens_in=0,
+            tokens_used=0,
+            lines=0,
+            blocks=0,
+            dropped_tokens=[],
+            warnings=[],
+        )
+        return GroupPageResult(
+            ok=False,
+            page_num=page_num,
+            source_ocr_relpath=ocr_out_relpath,
+            lines=[],
+            blocks=[],
+            errors=[
+                GroupError(
+                    code="GROUP_OCR_PAGE_NUM_AMBIGUOUS",
+                    message="OCR page artifact contains multiple page entries matching ledger page_num",
+                    detail={"ledger_page_num": page_num, "match_count": len(matching_pages)},
+                )
+            ],
+            meta=meta,
+        )
+
+    tokens_raw = matching_pages[0].get("tokens")
+    if not isinstance(tokens_raw, list):
+        meta = _page_meta(
+            params=params,
+            derived=zero_derived,
+            tokens_in=0,
+            tokens_used=0,
+            lines=0,
+            blocks=0,
+            dropped_tokens=[],
+            warnings=[],
+        )
+        return GroupPageResult(
+            ok=False,
+            page_num=page_num,
+            source_ocr_relpath=ocr_out_relpath,
+            lines=[],
+            blocks=[],
+            errors=[
+                GroupError(
+                    code="GROUP_OCR_BAD_SHAPE",
+                    message="OCR page entry missing tokens[]",
+                    detail={"ocr_out_relpath": ocr_out_relpath, "ledger_page_num": page_num},
+                )
+            ],
+            meta=meta,
+        )
+
+    token_refs: list[GroupTokenRef] = []
+    bad_token = False
+    for t in tokens_raw:
+        if not isinstance(t, dict):
+            bad_token = True
+            break
+        token_id = t.get("token_id")
+        text = t.get("text")
+        bbox_d = t.get("bbox")
+        if not isinstance(token_id, str) or not isinstance(text, str) or not isinstance(bbox_d, dict):
+            bad_token = True
+            break
+        bbox = _bbox_from_dict(bbox_d)
+        if bbox is None:
+            bad_token = True
+            break
+        conf_val = t.get("confidence")
+        conf: float | None
+        if conf_val is None:
+            conf = None
+        else:
+            try:
+                conf = float(conf_val)
+            except Exception:
+                conf = None
+            # NaN/Infinity (accepted by the stdlib parser fallback) count as missing: JSON
+            # cannot spell them, and the artifact writers would otherwise disagree on them.
+            if conf is not None and not math.isfinite(conf):
+                conf = None
+
+        token_refs.append(make_group_token_ref(token_id, text, bbox, conf))
+
+    if bad_token:
+        meta = _page_meta(
+            params=params,
+            derived=zero_derived,
+            tokens_in=len(token_refs),
+            tokens_used=0,
+            lines=0,
+            blocks=0,
+            dropped_tokens=[],
+            warnings=[],
+        )
+        return GroupPageResult(
+            ok=False,
+            page_num=page_num,
+            source_ocr_relpath=ocr_out_relpath,
+            lines=[],
+            blocks=[],
+            errors=[
+                GroupError(
+                    code="GROUP_OCR_BAD_SHAPE",
+                    message="OCR token rows missing required fields (token_id,text,bbox)",
+                    detail={"ocr_out_relpath": ocr_out_relpath},
+                )
+            ],
+            meta=meta,
+        )
+
+    tokens_used, dropped_tokens, warnings = _preprocess_tokens(tokens=token_refs, cfg=cfg)
+
+    if len(tokens_used) == 0:
+        lines = []
+        blocks = []
+        derived = zero_derived
+    else:
+        lines, line_meta = group_tokens_into_lines(tokens=tokens_used, page_num=page_num, cfg=cfg)
+        blocks, block_meta = group_lines_into_blocks(lines=lines, page_num=page_num, cfg=cfg)
+        derived = {**zero_derived, **line_meta, **block_meta}
+
+    meta = _page_meta(
+        params=params,
+        derived=derived,
+        tokens_in=len(token_refs),
+        tokens_used=len(tokens_used),
+        lines=len(lines),
+        blocks=len(blocks),
+        dropped_tokens=dropped_tokens,
+        warnings=warnings,
+    )
+    return GroupPageResult(
+        ok=True,
+        page_num=page_num,
+        source_ocr_relpath=ocr_out_relpath,
+        lines=lines,
+        blocks=blocks,
+        errors=[],
+        meta=meta,
+    )
+
+
+def _page_ref(*, page_result: GroupPageResult, group_out_relpath: str) -> GroupDocPageRef:
+    return GroupDocPageRef(
+        page_num=page_result.page_num,
+        source_ocr_relpath=page_result.source_ocr_relpath,
+        group_out_relpath=group_out_relpath,
+        ok=page_result.ok,
+        errors=page_result.errors,
+    )
+
+
+def _group_and_write_page(page: tuple[int, str, Path, str], **page_kw: Any) -> GroupDocPageRef:
+    # Worker-process entry point: the artifact is written in the worker and only the small
+    # page ref is sent back, so full page results never cross the process boundary.
+    page_num, ocr_out_relpath, out_file, out_relpath = page
+    page_result = _group_page(page_num=page_num, ocr_out_relpath=ocr_out_relpath, **page_kw)
+    write_group_json_artifact(result=page_result, out_file=out_file)
+    return _page_ref(page_result=page_result, group_out_relpath=out_relpath)
+
 
 def run_group_on_ocr_doc_ledger(
     *,
@@ -357,7 +813,18 @@ def run_group_on_ocr_doc_ledger(
     out_dir: Path,
     out_doc_manifest: Path | None,
     config: GroupingConfigDoc | None = None,
+    jobs: int = 1,
 ) -> GroupDocResult:
+    """
+    Group every page of a Stage 1 OCR document ledger and write the Stage 2 artifacts.
+
+    `jobs` is the number of worker processes: 1 (default) groups in-process, 0 or less means
+    one per CPU. Workers are started with "spawn", which re-imports the caller's main module
+    in every worker. A script that calls this with `jobs != 1` must therefore keep the call
+    under `if __name__ == "__main__":`; otherwise every worker re-runs the script, the pool
+    breaks and a RuntimeError pointing at the missing guard is raised.
+    """
+
     repo_root = _repo_root()
     cfg = GroupingConfigDoc() if config is None else config
 
@@ -426,7 +893,7 @@ def run_group_on_ocr_doc_ledger(
         )
 
     try:
-        payload = json.loads(ledger_file.read_text(encoding="utf-8"))
+        payload = _load_json(ledger_file)
     except Exception as e:
         return GroupDocResult(
             doc_id="",
@@ -541,411 +1008,76 @@ def run_group_on_ocr_doc_ledger(
     normalized_pages = list(pages_in)
     normalized_pages.sort(key=lambda p: p["page_num"])
 
-    page_refs: list[GroupDocPageRef] = []
-    for p in normalized_pages:
-        page_num: int = p["page_num"]
-        ocr_out_relpath: str = p["ocr_out_relpath"]
-
-        out_file = out_dir_abs / doc_id / f"page_{page_num:03d}.group.json"
+    # cfg is fixed for the run: build the per-page params/neutral-derived dicts once.
+    params = _params_dict(cfg)
+    zero_derived = _zero_derived(cfg)
+
+    out_doc_dir = out_dir_abs / doc_id
+    pages_todo: list[tuple[int, str, Path, str]] = []
+    if normalized_pages:
+        # Repo-relative output dir derived once; each page only appends its file name.
+        out_doc_rel = out_doc_dir.relative_to(repo_root)
+        for p in normalized_pages:
+            name = f"page_{p['page_num']:03d}.group.json"
+            out_relpath = (out_doc_rel / name).as_posix()
+            pages_todo.append((p["page_num"], p["ocr_out_relpath"], out_doc_dir / name, out_relpath))
+    page_kw = {"repo_root": repo_root, "cfg": cfg, "params": params, "zero_derived": zero_derived}
+
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    page_refs: list[GroupDocPageRef]
+    if jobs > 1 and len(pages_todo) > 1:
+        workers = min(jobs, len(pages_todo))
+        # Pages are independent; map() returns refs in submission order, i.e. by page_num.
+        # Pages travel in chunks (~4 per worker round) so long documents do not pay one IPC
+        # round trip per page; short ones still get one page per task.
+        chunksize = max(1, len(pages_todo) // (workers * 4))
+        # Imported here: it pulls in multiprocessing, which in-process runs never need.
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # "spawn", not the Linux default fork: forking a parent whose native thread pools
+        # (BLAS/OpenMP/TBB in optional deps, the caller's own threads) are already running
+        # can deadlock the children.
+        mp_context = multiprocessing.get_context("spawn")
+        from concurrent.futures.process import BrokenProcessPool
 
-        ocr_file = (repo_root / ocr_out_relpath).resolve()
         try:
-            ocr_file.relative_to(repo_root)
-        except Exception:
-            meta = _page_meta(
-                cfg=cfg,
-                derived=_zero_derived(cfg),
-                tokens_in=0,
-                tokens_used=0,
-                lines=0,
-                blocks=0,
-                dropped_tokens=[],
-                warnings=[],
-            )
-            page_result = GroupPageResult(
-                ok=False,
-                page_num=page_num,
-                source_ocr_relpath=ocr_out_relpath,
-                lines=[],
-                blocks=[],
-                errors=[
-                    GroupError(
-                        code="GROUP_OCR_RELPATH_OUTSIDE_REPO",
-                        message="ocr_out_relpath must resolve under repo root",
-                        detail={
-                            "ocr_out_relpath": ocr_out_relpath,
-                            "repo_root": str(repo_root),
-                            "resolved": str(ocr_file),
-                        },
-                    )
-                ],
-                meta=meta,
-            )
-            write_group_json_artifact(result=page_result, out_file=out_file)
-            page_refs.append(
-                GroupDocPageRef(
-                    page_num=page_num,
-                    source_ocr_relpath=ocr_out_relpath,
-                    group_out_relpath=out_file.relative_to(repo_root).as_posix(),
-                    ok=False,
-                    errors=page_result.errors,
-                )
-            )
-            continue
-
-        if not ocr_file.exists():
-            meta = _page_meta(
-                cfg=cfg,
-                derived=_zero_derived(cfg),
-                tokens_in=0,
-                tokens_used=0,
-                lines=0,
-                blocks=0,
-                dropped_tokens=[],
-                warnings=[],
-            )
-            page_result = GroupPageResult(
-                ok=False,
-                page_num=page_num,
-                source_ocr_relpath=ocr_out_relpath,
-                lines=[],
-                blocks=[],
-                errors=[
-                    GroupError(
-                        code="GROUP_SOURCE_OCR_MISSING",
-                        message="Expected OCR page artifact missing on disk",
-                        detail={"ocr_out_relpath": ocr_out_relpath, "resolved": str(ocr_file)},
-                    )
-                ],
-                meta=meta,
-            )
-            write_group_json_artifact(result=page_result, out_file=out_file)
-            page_refs.append(
-                GroupDocPageRef(
-                    page_num=page_num,
-                    source_ocr_relpath=ocr_out_relpath,
-                    group_out_relpath=out_file.relative_to(repo_root).as_posix(),
-                    ok=False,
-                    errors=page_result.errors,
-                )
-            )
-            continue
-
-        try:
-            ocr_payload = json.loads(ocr_file.read_text(encoding="utf-8"))
-        except Exception as e:
-            meta = _page_meta(
-                cfg=cfg,
-                derived=_zero_derived(cfg),
-                tokens_in=0,
-                tokens_used=0,
-                lines=0,
-                blocks=0,
-                dropped_tokens=[],
-                warnings=[],
-            )
-            page_result = GroupPageResult(
-                ok=False,
-                page_num=page_num,
-                source_ocr_relpath=ocr_out_relpath,
-                lines=[],
-                blocks=[],
-                errors=[
-                    GroupError(
-                        code="GROUP_OCR_INVALID_JSON",
-                        message="Failed to parse OCR page JSON",
-                        detail={"ocr_out_relpath": ocr_out_relpath, "error": repr(e)},
-                    )
-                ],
-                meta=meta,
-            )
-            write_group_json_artifact(result=page_result, out_file=out_file)
-            page_refs.append(
-                GroupDocPageRef(
-                    page_num=page_num,
-                    source_ocr_relpath=ocr_out_relpath,
-                    group_out_relpath=out_file.relative_to(repo_root).as_posix(),
-                    ok=False,
-                    errors=page_result.errors,
-                )
-            )
-            continue
-
-        # Extract tokens from the Stage 1 per-page OCR artifact by matching the ledger page_num.
-        pages = ocr_payload.get("pages")
-        if not isinstance(pages, list):
-            meta = _page_meta(
-                cfg=cfg,
-                derived=_zero_derived(cfg),
-                tokens_in=0,
-                tokens_used=0,
-                lines=0,
-                blocks=0,
-                dropped_tokens=[],
-                warnings=[],
-            )
-            page_result = GroupPageResult(
-                ok=False,
-                page_num=page_num,
-                source_ocr_relpath=ocr_out_relpath,
-                lines=[],
-                blocks=[],
-                errors=[
-                    GroupError(
-                        code="GROUP_OCR_BAD_SHAPE",
-                        message="OCR page artifact missing pages[]",
-                        detail={"ocr_out_relpath": ocr_out_relpath},
-                    )
-                ],
-                meta=meta,
-            )
-            write_group_json_artifact(result=page_result, out_file=out_file)
-            page_refs.append(
-                GroupDocPageRef(
-                    page_num=page_num,
-                    source_ocr_relpath=ocr_out_relpath,
-                    group_out_relpath=out_file.relative_to(repo_root).as_posix(),
-                    ok=False,
-                    errors=page_result.errors,
-                )
-            )
-            continue
-
-        matching_pages: list[dict[str, Any]] = []
-        for pe in pages:
-            if not isinstance(pe, dict):
-                continue
-            if pe.get("page_num") == page_num:
-                matching_pages.append(pe)
-
-        if len(matching_pages) == 0:
-            available = sorted(
-                [
-                    int(pe.get("page_num"))
-                    for pe in pages
-                    if isinstance(pe, dict) and isinstance(pe.get("page_num"), int)
-                ]
-            )
-            meta = _page_meta(
-                cfg=cfg,
-                derived=_zero_derived(cfg),
-                tokens_in=0,
-                tokens_used=0,
-                lines=0,
-                blocks=0,
-                dropped_tokens=[],
-                warnings=[],
-            )
-            page_result = GroupPageResult(
-                ok=False,
-                page_num=page_num,
-                source_ocr_relpath=ocr_out_relpath,
-                lines=[],
-                blocks=[],
-                errors=[
-                    GroupError(
-                        code="GROUP_OCR_PAGE_NUM_MISMATCH",
-                        message="OCR page artifact contains no page entry matching ledger page_num",
-                        detail={"ledger_page_num": page_num, "available_page_nums": available},
-                    )
-                ],
-                meta=meta,
-            )
-            write_group_json_artifact(result=page_result, out_file=out_file)
-            page_refs.append(
-                GroupDocPageRef(
-                    page_num=page_num,
-                    source_ocr_relpath=ocr_out_relpath,
-                    group_out_relpath=out_file.relative_to(repo_root).as_posix(),
-                    ok=False,
-                    errors=page_result.errors,
-                )
-            )
-            continue
-
-        if len(matching_pages) > 1:
-            meta = _page_meta(
-                cfg=cfg,
-                derived=_zero_derived(cfg),
-                tokens_in=0,
-                tokens_used=0,
-                lines=0,
-                blocks=0,
-                dropped_tokens=[],
-                warnings=[],
-            )
-            page_result = GroupPageResult(
-                ok=False,
-                page_num=page_num,
-                source_ocr_relpath=ocr_out_relpath,
-                lines=[],
-                blocks=[],
-                errors=[
-                    GroupError(
-                        code="GROUP_OCR_PAGE_NUM_AMBIGUOUS",
-                        message="OCR page artifact contains multiple page entries matching ledger page_num",
-                        detail={"ledger_page_num": page_num, "match_count": len(matching_pages)},
-                    )
-                ],
-                meta=meta,
-            )
-            write_group_json_artifact(result=page_result, out_file=out_file)
-            page_refs.append(
-                GroupDocPageRef(
-                    page_num=page_num,
-                    source_ocr_relpath=ocr_out_relpath,
-                    group_out_relpath=out_file.relative_to(repo_root).as_posix(),
-                    ok=False,
-                    errors=page_result.errors,
+            with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as ex:
+                page_refs = list(
+                    ex.map(functools.partial(_group_and_write_page, **page_kw), pages_todo, chunksize=chunksize)
                 )
-            )
-            continue
-
-        tokens_raw = matching_pages[0].get("tokens")
-        if not isinstance(tokens_raw, list):
-            meta = _page_meta(
-                cfg=cfg,
-                derived=_zero_derived(cfg),
-                tokens_in=0,
-                tokens_used=0,
-                lines=0,
-                blocks=0,
-                dropped_tokens=[],
-                warnings=[],
-            )
-            page_result = GroupPageResult(
-                ok=False,
-                page_num=page_num,
-                source_ocr_relpath=ocr_out_relpath,
-                lines=[],
-                blocks=[],
-                errors=[
-                    GroupError(
-                        code="GROUP_OCR_BAD_SHAPE",
-                        message="OCR page entry missing tokens[]",
-                        detail={"ocr_out_relpath": ocr_out_relpath, "ledger_page_num": page_num},
+        except BrokenProcessPool as e:
+            raise RuntimeError(
+                "A grouping worker process exited abruptly. Workers are started with 'spawn' and "
+                "re-import the main module: when calling run_group_on_ocr_doc_ledger(jobs != 1) "
+                "from a script, put the call under `if __name__ == \"__main__\":`."
+            ) from e
+    else:
+        page_refs = []
+
+        def grouped_pages() -> Iterator[tuple[GroupPageResult, Path]]:
+            # OCR files are read a few pages ahead on a reader thread, so the disk (or network
+            # share) works while the current page is grouped. Only bytes are read ahead; parsing
+            # stays here, and at most _READ_AHEAD_PAGES files are held at a time.
+            with ThreadPoolExecutor(max_workers=1) as reader:
+                reads: deque[Future[bytes | None]] = deque()
+                for ahead in pages_todo[:_READ_AHEAD_PAGES]:
+                    reads.append(reader.submit(_read_ahead_ocr_bytes, repo_root, ahead[1]))
+                for i, (page_num, ocr_out_relpath, out_file, out_relpath) in enumerate(pages_todo):
+                    ocr_bytes = reads.popleft().result()
+                    if i + _READ_AHEAD_PAGES < len(pages_todo):
+                        ahead = pages_todo[i + _READ_AHEAD_PAGES]
+                        reads.append(reader.submit(_read_ahead_ocr_bytes, repo_root, ahead[1]))
+                    page_result = _group_page(
+                        page_num=page_num, ocr_out_relpath=ocr_out_relpath, ocr_bytes=ocr_bytes, **page_kw
                     )
-                ],
-                meta=meta,
-            )
-            write_group_json_artifact(result=page_result, out_file=out_file)
-            page_refs.append(
-                GroupDocPageRef(
-                    page_num=page_num,
-                    source_ocr_relpath=ocr_out_relpath,
-                    group_out_relpath=out_file.relative_to(repo_root).as_posix(),
-                    ok=False,
-                    errors=page_result.errors,
-                )
-            )
-            continue
+                    page_refs.append(_page_ref(page_result=page_result, group_out_relpath=out_relpath))
+                    yield page_result, out_file
 
-        token_refs: list[GroupTokenRef] = []
-        bad_token = False
-        for t in tokens_raw:
-            if not isinstance(t, dict):
-                bad_token = True
-                break
-            token_id = t.get("token_id")
-            text = t.get("text")
-            bbox_d = t.get("bbox")
-            if not isinstance(token_id, str) or not isinstance(text, str) or not isinstance(bbox_d, dict):
-                bad_token = True
-                break
-            bbox = _bbox_from_dict(bbox_d)
-            if bbox is None:
-                bad_token = True
-                break
-            conf_val = t.get("confidence")
-            conf: float | None
-            if conf_val is None:
-                conf = None
-            else:
-                try:
-                    conf = float(conf_val)
-                except Exception:
-                    conf = None
-
-            token_refs.append(GroupTokenRef(token_id=token_id, text=text, bbox=bbox, confidence=conf))
-
-        if bad_token:
-            meta = _page_meta(
-                cfg=cfg,
-                derived=_zero_derived(cfg),
-                tokens_in=len(token_refs),
-                tokens_used=0,
-                lines=0,
-                blocks=0,
-                dropped_tokens=[],
-                warnings=[],
-            )
-            page_result = GroupPageResult(
-                ok=False,
-                page_num=page_num,
-                source_ocr_relpath=ocr_out_relpath,
-                lines=[],
-                blocks=[],
-                errors=[
-                    GroupError(
-                        code="GROUP_OCR_BAD_SHAPE",
-                        message="OCR token rows missing required fields (token_id,text,bbox)",
-                        detail={"ocr_out_relpath": ocr_out_relpath},
-                    )
-                ],
-                meta=meta,
-            )
-            write_group_json_artifact(result=page_result, out_file=out_file)
-            page_refs.append(
-                GroupDocPageRef(
-                    page_num=page_num,
-                    source_ocr_relpath=ocr_out_relpath,
-                    group_out_relpath=out_file.relative_to(repo_root).as_posix(),
-                    ok=False,
-                    errors=page_result.errors,
-                )
-            )
-            continue
-
-        tokens_used, dropped_tokens, warnings = _preprocess_tokens(tokens=token_refs, cfg=cfg)
-
-        if len(tokens_used) == 0:
-            lines = []
-            blocks = []
-            derived = _zero_derived(cfg)
-        else:
-            lines, line_meta = group_tokens_into_lines(tokens=tokens_used, page_num=page_num, cfg=cfg)
-            blocks, block_meta = group_lines_into_blocks(lines=lines, page_num=page_num, cfg=cfg)
-            derived = {**_zero_derived(cfg), **line_meta, **block_meta}
-
-        meta = _page_meta(
-            cfg=cfg,
-            derived=derived,
-            tokens_in=len(token_refs),
-            tokens_used=len(tokens_used),
-            lines=len(lines),
-            blocks=len(blocks),
-            dropped_tokens=dropped_tokens,
-            warnings=warnings,
-        )
-        page_result = GroupPageResult(
-            ok=True,
-            page_num=page_num,
-            source_ocr_relpath=ocr_out_relpath,
-            lines=lines,
-            blocks=blocks,
-            errors=[],
-            meta=meta,
-        )
-        write_group_json_artifact(result=page_result, out_file=out_file)
-        page_refs.append(
-            GroupDocPageRef(
-                page_num=page_num,
-                source_ocr_relpath=ocr_out_relpath,
-                group_out_relpath=out_file.relative_to(repo_root).as_posix(),
-                ok=True,
-                errors=[],
-            )
-        )
+        # Pages go to the writer threads as soon as they are grouped: disk writes overlap the
+        # grouping of later pages, and written results are released instead of held to the end.
+        write_group_json_artifacts_batch(grouped_pages())
 
     failed_pages = [p.page_num for p in page_refs if not p.ok]
     doc_errors: list[GroupError] = []
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, Iterator
+
+from contracts import BBox, EvidenceRef, GroupingResult, Line, OCRResult, RegionType
+from contracts.grouping_doc_mode import GroupTokenRef, make_group_token_ref
+from contracts.ocr import _ocr_result_from_events, make_bbox
+
+try:
+    import ijson  # type: ignore
+except ImportError:  # optional; the synthetic event stream below needs no parser
+    ijson = None
+
+
+def _json_events(value: Any, prefix: str = "") -> Iterator[tuple[str, str, Any]]:
+    # The (prefix, event, value) stream ijson.parse(f, use_float=True) yields for `value`.
+    if isinstance(value, dict):
+        yield prefix, "start_map", None
+        for k, v in value.items():
+            yield prefix, "map_key", k
+            yield from _json_events(v, f"{prefix}.{k}" if prefix else k)
+        yield prefix, "end_map", None
+    elif isinstance(value, list):
+        yield prefix, "start_array", None
+        for v in value:
+            yield from _json_events(v, f"{prefix}.item" if prefix else "item")
+        yield prefix, "end_array", None
+    elif value is None:
+        yield prefix, "null", None
+    elif isinstance(value, bool):
+        yield prefix, "boolean", value
+    elif isinstance(value, (int, float)):
+        yield prefix, "number", value
+    else:
+        yield prefix, "string", value
+
+
+class _ObjectBuilder:
+    # Same contract as ijson.ObjectBuilder: feed events, read `.value`.
+    def __init__(self) -> None:
+        self.value: Any = None
+        self.key: Any = None
+        self.containers: list[Any] = [lambda v: setattr(self, "value", v)]
+
+    def event(self, event: str, value: Any) -> None:
+        if event == "map_key":
+            self.key = value
+        elif event == "start_map":
+            mapping: dict[str, Any] = {}
+            self.containers[-1](mapping)
+            self.containers.append(lambda v: mapping.__setitem__(self.key, v))
+        elif event == "start_array":
+            array: list[Any] = []
+            self.containers[-1](array)
+            self.containers.append(array.append)
+        elif event in ("end_map", "end_array"):
+            self.containers.pop()
+        else:
+            self.containers[-1](value)
+
+
+class TestContractsFromDict(unittest.TestCase):
+    def test_ocr_result_round_trip_and_coercion(self) -> None:
+        raw = {
+            "engine": "tesseract_cli",
+            "ok": 1,
+            "errors": ["E_A", {"code": "E_B", "detail": "x"}],
+            "meta": {"k": "v"},
+            "pages": [
+                {
+                    "page_num": "1",
+                    "tokens": [
+                        {
+                            "token_id": "p001_t000000",
+                            "page_num": 1,
+                            "bbox": {"x0": "1", "y0": 2, "x1": 3.0, "y1": 4},
+                            "confidence": "0.5",
+                            "raw_confidence": None,
+                        }
+                    ],
+                }
+            ],
+            "source_image_relpath": None,
+        }
+        res = OCRResult.from_dict(raw)
+        self.assertTrue(res.ok)
+        self.assertEqual(res.errors, ["E_A", "E_B"])
+        tok = res.pages[0].tokens[0]
+        self.assertEqual(tok.text, "")
+        self.assertEqual((tok.bbox.x0, tok.bbox.x1), (1, 3))
+        self.assertEqual(tok.confidence, 0.5)
+        self.assertIsNone(tok.raw_confidence)
+        self.assertIsNone(res.doc_id)
+        self.assertEqual(OCRResult.from_dict(res.to_dict()), res)
+
+    def test_exact_typed_and_coerced_inputs_agree(self) -> None:
+        bbox = {"x0": 1, "y0": 2, "x1": 3, "y1": 4}
+        typed = {"token_id": "t1", "page_num": 1, "text": "a", "bbox": bbox, "confidence": 0.5, "raw_confidence": None}
+        loose = dict(typed, page_num="1", confidence="0.5", raw_confidence=None, bbox={"x0": "1", "y0": 2.0, "x1": 3, "y1": 4})
+        page = OCRResult.from_dict({"pages": [{"page_num": 1, "tokens": [typed, loose]}]}).pages[0]
+        self.assertEqual(page.tokens[0], page.tokens[1])
+        # An int where a float is declared is not exact-typed; it is still coerced.
+        tok = OCRResult.from_dict({"pages": [{"page_num": 1, "tokens": [dict(typed, confidence=1)]}]}).pages[0].tokens[0]
+        self.assertIs(type(tok.confidence), float)
+
+    def test_ocr_result_from_path_matches_from_dict(self) -> None:
+        raw = {
+            "engine": "tesseract_cli",
+            "ok": True,
+            "errors": [{"code": "E_B"}],
+            "meta": {"pages": [1, 2]},
+            "pages": [
+                {
+                    "page_num": 1,
+                    "tokens": [{"token_id": "t1", "page_num": 1, "bbox": {"x0": 0, "y0": 0, "x1": 2, "y1": 2}}],
+                },
+                {"page_num": 2},
+            ],
+            "source_image_relpath": "artifacts/x/page_001.png",
+            "doc_id": "doc",
+        }
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "page_001.ocr.json"
+            path.write_text(json.dumps(raw), encoding="utf-8")
+            self.assertEqual(OCRResult.from_path(path), OCRResult.from_dict(raw))
+
+            path.write_text(json.dumps({"pages": [{"page_num": 1, "tokens": "x"}]}), encoding="utf-8")
+            with self.assertRaisesRegex(TypeError, "OCRPage.tokens must be a list"):
+                OCRResult.from_path(path)
+
+    def test_ocr_result_event_walker_matches_from_dict(self) -> None:
+        token = {"token_id": "t1", "page_num": "1", "text": "Ø", "bbox": {"x0": 0, "y0": 0.0, "x1": 2, "y1": 2}}
+        cases: list[Any] = [
+            {
+                "engine": "tesseract_cli",
+                "ok": True,
+                "errors": ["E_A", {"code": "E_B", "detail": {"tokens": [1]}}],
+                "meta": {"pages": [{"tokens": []}], "nested": {"a": [None, False, 0.5]}},
+                "pages": [
+                    # Keys around `tokens`, nested values inside a page, and a page without tokens.
+                    {"extra": {"tokens": [1]}, "page_num": 1, "tokens": [token, dict(token, token_id="t2")], "k": [1]},
+                    {"page_num": 2},
+                    {"tokens": [], "page_num": "3"},
+                ],
+                "source_image_relpath": "artifacts/x/page_001.png",
+                "doc_id": "doc",
+            },
+            {"pages": [], "ok": False},
+            {"ok": True, "pages": [{"page_num": 1, "tokens": [token]}], "meta": {"after": "pages"}},
+        ]
+        bad_cases: list[Any] = [
+            {"pages": [{"page_num": 1, "tokens": "x"}]},
+            {"pages": {"page_num": 1}},
+            {"pages": [{"page_num": 1, "tokens": [dict(token, bbox=None)]}]},
+            {"errors": [{"detail": "x"}], "pages": []},
+            [1, 2],
+        ]
+        builders: list[type] = [_ObjectBuilder] + ([ijson.ObjectBuilder] if ijson is not None else [])
+        for builder_cls in builders:
+            for raw in cases:
+                with self.subTest(builder=builder_cls.__module__, raw=raw):
+                    if ijson is not None:
+                        ijson_events = list(ijson.parse(json.dumps(raw).encode("utf-8"), use_float=True))
+                        self.assertEqual(list(_json_events(raw)), ijson_events)
+                    self.assertEqual(_ocr_result_from_events(_json_events(raw), builder_cls), OCRResult.from_dict(raw))
+            for raw in bad_cases:
+                with self.subTest(builder=builder_cls.__module__, raw=raw):
+                    with self.assertRaises(Exception) as expected:
+                        OCRResult.from_dict(raw)
+                    with self.assertRaises(type(expected.exception)) as got:
+                        _ocr_result_from_events(_json_events(raw), builder_cls)
+                    self.assertEqual(str(got.exception), str(expected.exception))
+
+    def test_ocr_result_rejects_malformed_lists(self) -> None:
+        with self.assertRaisesRegex(TypeError, "OCRResult.pages must be a list"):
+            OCRResult.from_dict({"pages": {"page_num": 1}})
+        with self.assertRaisesRegex(TypeError, "OCRPage.tokens must be a list"):
+            OCRResult.from_dict({"pages": [{"page_num": 1, "tokens": "x"}]})
+        with self.assertRaisesRegex(TypeError, "must include 'code'"):
+            OCRResult.from_dict({"errors": [{"detail": "x"}]})
+
+    def test_grouping_result_round_trip(self) -> None:
+        bbox = {"x0": 0, "y0": 0, "x1": 10, "y1": 10}
+        raw = {
+            "ok": True,
+            "errors": [],
+            "meta": {},
+            "pages": [
+                {
+                    "page_num": 1,
+                    "lines": [{"line_id": "l1", "page_num": 1, "token_ids": ["t1"], "line_bbox": bbox}],
+                    "regions": [
+                        {"region_id": "r1", "page_num": 1, "region_type": "NOTE", "region_bbox": bbox},
+                    ],
+                }
+            ],
+            "source_ocr_relpath": "artifacts/x.ocr.json",
+        }
+        res = GroupingResult.from_dict(raw)
+        page = res.pages[0]
+        self.assertEqual(page.blocks, [])
+        self.assertEqual(page.regions[0].region_type, RegionType.NOTE)
+        self.assertEqual(page.regions[0].block_ids, ())
+        self.assertEqual(GroupingResult.from_dict(res.to_dict()), res)
+        shared = res.to_dict(copy=False)
+        self.assertIs(shared["meta"], res.meta)
+        self.assertIsNot(res.to_dict()["meta"], res.meta)
+        # Ids are interned: equal id strings from separate parses share one object.
+        again = GroupingResult.from_dict(shared)
+        self.assertIs(again.pages[0].lines[0].token_ids[0], page.lines[0].token_ids[0])
+
+    def test_id_lists_are_normalized_to_tuples(self) -> None:
+        bbox = BBox(x0=0, y0=0, x1=5, y1=5)
+        built = Line(line_id="l1", page_num=1, token_ids=["t1", "t2"], line_bbox=bbox)
+        loaded = Line.from_dict({"line_id": "l1", "page_num": 1, "token_ids": ["t1", "t2"], "line_bbox": bbox.to_dict()})
+        self.assertEqual(built.token_ids, ("t1", "t2"))
+        self.assertEqual((built, hash(built)), (loaded, hash(loaded)))
+        self.assertEqual(EvidenceRef(page_num=1, line_ids=["l1"]).line_ids, ("l1",))
+        self.assertIsNone(EvidenceRef(page_num=1).token_ids)
+
+    def test_bbox_cached_geometry_stays_out_of_schema(self) -> None:
+        b = BBox.from_dict({"x0": 10, "y0": 20, "x1": 5, "y1": 26})
+        self.assertEqual((b.width(), b.height(), b.area()), (-5, 6, 0))
+        self.assertEqual([f.name for f in dataclasses.fields(b)], ["x0", "y0", "x1", "y1"])
+        self.assertEqual(dataclasses.asdict(b), b.to_dict())
+        b2 = pickle.loads(pickle.dumps(b))
+        self.assertEqual((b2, b2.area()), (b, 0))
+        self.assertEqual(dataclasses.replace(b, x1=12).area(), 12)
+
+    def test_make_bbox_matches_constructor(self) -> None:
+        for coords in [(1, 2, 30, 12), (10, 20, 5, 26), (0, 0, 0, 0)]:
+            fast, slow = make_bbox(*coords), BBox(*coords)
+            self.assertEqual((fast, hash(fast), repr(fast)), (slow, hash(slow), repr(slow)))
+            self.assertEqual((fast.width(), fast.height(), fast.area()), (slow.width(), slow.height(), slow.area()))
+            self.assertEqual(pickle.loads(pickle.dumps(fast)), slow)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            make_bbox(0, 0, 1, 1).x0 = 5  # type: ignore[misc]
+
+    def test_make_group_token_ref_matches_constructor(self) -> None:
+        bbox = make_bbox(1, 2, 30, 12)
+        for conf in (0.5, None):
+            fast = make_group_token_ref("p001_t000000", "x", bbox, conf)
+            slow = GroupTokenRef(token_id="p001_t000000", text="x", bbox=bbox, confidence=conf)
+            self.assertEqual((fast, hash(fast), repr(fast), fast.to_dict()), (slow, hash(slow), repr(slow), slow.to_dict()))
+            self.assertEqual(pickle.loads(pickle.dumps(fast)), slow)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            fast.text = "y"  # type: ignore[misc]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import shutil
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from grouping.doc_module import run_group_on_ocr_doc_ledger
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+# tools/ is not a package; spawned render workers inherit this sys.path entry.
+sys.path.insert(0, str(_REPO_ROOT / "tools"))
+
+import debug_print_grouping  # noqa: E402
+
+# Printer output for the fixture in test_golden_output_on_both_json_backends (repo root masked).
+_GOLDEN_STDOUT = """\
+Repo root: <repo>
+Input: artifacts/_test_debug_print/golden/group_doc.json
+Mode: doc  Pages: 3
+Wrote report: <repo>/artifacts/_test_debug_print/golden/reports/doc_test_debug_print/group_doc_grouping_report.txt
+Wrote index: <repo>/artifacts/_test_debug_print/golden/reports/doc_test_debug_print/index.txt
+
+=== Page 1 ===  ok=True
+Counts:
+  tokens_in: 3
+  tokens_used: 3
+  lines: 1
+  blocks: 1
+  dropped_tokens_count: 0
+  warnings_count: 1
+Derived:
+  median_token_height_px: 20
+  line_y_tol_px: 10
+  refined_bins: 1
+  median_line_height_px: 20
+  median_line_gap_px: 0
+  gap_threshold_px: 30
+  overlap_threshold: 0.1
+Warnings (1):
+  - GROUP_BBOX_REPAIRED: Token bbox endpoints were swapped deterministically
+
+Line text snippets:
+  [p001_l0000] Ø12 "M6" A
+
+Block text snippets:
+  [p001_b0000] Ø12 "M6" A
+
+Bounds: x[10,170] y[15,35]  Legend: blocks='#' lines='-' tokens='.'
++------------------------------+
+|------------------------------|
+|-                            -|
+|-                            -|
+|-                            -|
+|-  .          .          .   -|
+|-                            -|
+|-                            -|
+|-                            -|
+|-                            -|
+|------------------------------|
++------------------------------+
+
+
+=== Page 2 ===  ok=True
+Counts:
+  tokens_in: 2
+  tokens_used: 2
+  lines: 1
+  blocks: 1
+  dropped_tokens_count: 0
+  warnings_count: 0
+Derived:
+  median_token_height_px: 20
+  line_y_tol_px: 10
+  refined_bins: 1
+  median_line_height_px: 20
+  median_line_gap_px: 0
+  gap_threshold_px: 30
+  overlap_threshold: 0.1
+
+Line text snippets:
+  [p002_l0000] NOTE: 1/2
+
+Block text snippets:
+  [p002_b0000] NOTE: 1/2
+
+Bounds: x[10,110] y[20,40]  Legend: blocks='#' lines='-' tokens='.'
++------------------------------+
+|------------------------------|
+|-                            -|
+|-                            -|
+|-                            -|
+|-    .                 .     -|
+|-                            -|
+|-                            -|
+|-                            -|
+|-                            -|
+|------------------------------|
++------------------------------+
+
+
+=== Page 3 ===  ok=False
+Errors:
+  - DEBUG_READ_GROUP_ARTIFACT_FAILED: JSONDecodeError('Expecting value: line 1 column 1 (char 0)')
+Counts:
+
+Bounds: x[0,1000] y[0,1000]  Legend: blocks='#' lines='-' tokens='.'
++------------------------------+
+|                              |
+|                              |
+|                              |
+|                              |
+|                              |
+|                              |
+|                              |
+|                              |
+|                              |
+|                              |
++------------------------------+
+
+"""
+
+_GOLDEN_REPORT = """\
+Grouping report
+repo_root: <repo>
+input: artifacts/_test_debug_print/golden/group_doc.json
+kind: doc
+page_count: 3
+
+Page 1: ok=true
+  meta: algorithm='lines_blocks' version='lines_blocks_v1'
+  counts: tokens_in=3 tokens_used=3 lines=1 blocks=1 dropped_tokens_count=0 warnings_count=1
+  derived:
+    gap_threshold_px: 30
+    line_y_tol_px: 10
+    median_line_gap_px: 0
+    median_line_height_px: 20
+    median_token_height_px: 20
+    overlap_threshold: 0.1
+    refined_bins: 1
+  warnings: 1
+    - GROUP_BBOX_REPAIRED: Token bbox endpoints were swapped deterministically detail={"after":{"x0":130,"x1":170,"y0":15,"y1":35},"before":{"x0":170,"x1":130,"y0":15,"y1":35},"token_id":"p001_t000002"}
+  dropped_tokens: 0
+  Regions: 0
+  Blocks: 1
+    Block p001_b0000 bbox=10,15,170,35 lines=1
+      text="Ø12 \\"M6\\" A"
+      line_ids: ['p001_l0000']
+      Line p001_l0000 bbox=10,15,170,35 tokens=3
+        text="Ø12 \\"M6\\" A"
+        tokens:
+          - p001_t000000 bbox=10,15,50,35 conf=0.9 text="Ø12"
+          - p001_t000001 bbox=70,15,110,35 conf=0.8 text="\\"M6\\""
+          - p001_t000002 bbox=130,15,170,35 conf=0.7 text="A"
+
+Page 2: ok=true
+  meta: algorithm='lines_blocks' version='lines_blocks_v1'
+  counts: tokens_in=2 tokens_used=2 lines=1 blocks=1 dropped_tokens_count=0 warnings_count=0
+  derived:
+    gap_threshold_px: 30
+    line_y_tol_px: 10
+    median_line_gap_px: 0
+    median_line_height_px: 20
+    median_token_height_px: 20
+    overlap_threshold: 0.1
+    refined_bins: 1
+  warnings: 0
+  dropped_tokens: 0
+  Regions: 0
+  Blocks: 1
+    Block p002_b0000 bbox=10,20,110,40 lines=1
+      text="NOTE: 1/2"
+      line_ids: ['p002_l0000']
+      Line p002_l0000 bbox=10,20,110,40 tokens=2
+        text="NOTE: 1/2"
+        tokens:
+          - p002_t000000 bbox=10,20,50,40 conf=0.9 text="NOTE:"
+          - p002_t000001 bbox=70,20,110,40 conf=0.8 text="1/2"
+
+Page 3: ok=false
+  meta: algorithm=None version=None
+  counts: tokens_in=0 tokens_used=0 lines=0 blocks=0 dropped_tokens_count=0 warnings_count=0
+  derived:
+  warnings: 0
+  dropped_tokens: 0
+  No structural content (ok=false)
+"""
+
+
+class TestDebugPrintGrouping(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = _REPO_ROOT / "artifacts" / "_test_debug_print"
+        if self.root.exists():
+            shutil.rmtree(self.root)
+
+    def _write_grouped_doc(self, root: Path, *, doc_id: str, page_words: list[list[str]]) -> Path:
+        # Runs Stage 2 on a synthetic OCR ledger; returns the grouping doc ledger path.
+        (root / "ocr").mkdir(parents=True, exist_ok=True)
+        ledger_pages = []
+        for page_num, words in enumerate(page_words, start=1):
+            tokens = []
+            for i, word in enumerate(words):
+                x0, y0 = 10 + 60 * i, 10 + 5 * page_num
+                bbox = {"x0": x0, "y0": y0, "x1": x0 + 40, "y1": y0 + 20}
+                if page_num % 3 == 1 and i == 2:
+                    bbox["x0"], bbox["x1"] = bbox["x1"], bbox["x0"]
+                tokens.append(
+                    {
+                        "token_id": f"p{page_num:03d}_t{i:06d}",
+                        "page_num": page_num,
+                        "text": word,
+                        "bbox": bbox,
+                        "confidence": round(0.9 - i / 10, 2),
+                    }
+                )
+            page_file = root / "ocr" / f"page_{page_num:03d}.ocr.json"
+            payload = {"ok": True, "pages": [{"page_num": page_num, "tokens": tokens}], "errors": [], "meta": {}}
+            page_file.write_text(json.dumps(payload) + "\n", encoding="utf-8")
+            ocr_out_relpath = page_file.relative_to(_REPO_ROOT).as_posix()
+            ledger_pages.append({"page_num": page_num, "ocr_out_relpath": ocr_out_relpath, "ok": True, "errors": []})
+        ledger = root / "ocr_doc.json"
+        ledger_payload = {"doc_id": doc_id, "ok": True, "pages": ledger_pages, "errors": [], "meta": {}}
+        ledger.write_text(json.dumps(ledger_payload) + "\n", encoding="utf-8")
+
+        r = run_group_on_ocr_doc_ledger(
+            ocr_doc_ledger=ledger.relative_to(_REPO_ROOT),
+            out_dir=(root / "grouping").relative_to(_REPO_ROOT),
+            out_doc_manifest=root / "group_doc.json",
+        )
+        self.assertTrue(r.ok)
+        return root / "group_doc.json"
+
+    def _run_main(self, argv: list[str]) -> str:
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            rc = debug_print_grouping.main(argv)
+        self.assertEqual(rc, 0)
+        return out.getvalue().replace(str(_REPO_ROOT), "<repo>")
+
+    def test_golden_output_on_both_json_backends(self) -> None:
+        root = self.root / "golden"
+        page_words = [["Ø12", '"M6"', "A"], ["NOTE:", "1/2"]]
+        manifest = self._write_grouped_doc(root, doc_id="doc_test_debug_print", page_words=page_words)
+        # Page 3 points at an empty artifact: the printer reports it instead of failing.
+        empty_page = root / "grouping" / "page_003.group.json"
+        empty_page.write_bytes(b"")
+        payload = json.loads(manifest.read_text(encoding="utf-8"))
+        payload["pages"].append({"page_num": 3, "group_out_relpath": empty_page.relative_to(_REPO_ROOT).as_posix()})
+        manifest.write_text(json.dumps(payload), encoding="utf-8")
+
+        argv = [
+            manifest.relative_to(_REPO_ROOT).as_posix(),
+            "--width", "30",
+            "--height", "10",
+            "--show-text",
+            "--write-report",
+            "--report-dir", (root / "reports").relative_to(_REPO_ROOT).as_posix(),
+        ]
+        report = root / "reports" / "doc_test_debug_print" / "group_doc_grouping_report.txt"
+        for label, orjson_mod in (("orjson", debug_print_grouping.orjson), ("stdlib", None)):
+            with self.subTest(backend=label), patch.object(debug_print_grouping, "orjson", orjson_mod):
+                self.assertEqual(self._run_main(argv), _GOLDEN_STDOUT)
+                report_text = report.read_text(encoding="utf-8").replace(str(_REPO_ROOT), "<repo>")
+                self.assertEqual(report_text, _GOLDEN_REPORT)
+
+    def test_jobs_output_matches_in_process(self) -> None:
+        # 16 pages with --jobs 2 -> render chunksize 16 // (2 * 4) = 2.
+        root = self.root / "jobs"
+        words = [[f"w{p}_{i}" for i in range(1 + p % 4)] for p in range(16)]
+        manifest = self._write_grouped_doc(root, doc_id="doc_test_debug_print_jobs", page_words=words)
+
+        def run(jobs: int) -> tuple[str, list[bytes]]:
+            report_dir = root / f"reports_{jobs}"
+            stdout = self._run_main(
+                [
+                    manifest.relative_to(_REPO_ROOT).as_posix(),
+                    "--width", "40",
+                    "--height", "8",
+                    "--write-token-grid",
+                    "--report-dir", report_dir.relative_to(_REPO_ROOT).as_posix(),
+                    "--jobs", str(jobs),
+                ]
+            )
+            grids = sorted(report_dir.rglob("page_*_token_grid.txt"))
+            self.assertEqual(len(grids), 16)
+            return stdout.replace(f"reports_{jobs}", "reports"), [g.read_bytes() for g in grids]
+
+        self.assertEqual(run(2), run(1))
+
+    def test_read_json_matches_stdlib(self) -> None:
+        self.root.mkdir(parents=True)
+        cases = {"empty": b"", "nan": b'{"a": NaN}', "invalid": b"{bad", "ok": '{"t": "Ø"}'.encode("utf-8")}
+        for name, data in cases.items():
+            p = self.root / f"{name}.json"
+            p.write_bytes(data)
+            try:
+                expected = repr(json.loads(data))
+            except json.JSONDecodeError as e:
+                expected = repr(e)
+            for orjson_mod in (debug_print_grouping.orjson, None):
+                with (
+                    self.subTest(case=name, orjson=orjson_mod is not None),
+                    patch.object(debug_print_grouping, "orjson", orjson_mod),
+                ):
+                    try:
+                        got = repr(debug_print_grouping._read_json(p))
+                    except json.JSONDecodeError as e:
+                        got = repr(e)
+                    self.assertEqual(got, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
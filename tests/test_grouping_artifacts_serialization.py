@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any
+
+from contracts.grouping_doc import GroupDocPageRef, GroupDocResult
+from contracts.grouping_doc_mode import (
+    GroupBBox,
+    GroupBlock,
+    GroupError,
+    GroupLine,
+    GroupPageResult,
+    GroupTokenRef,
+)
+from grouping import artifacts, doc_artifacts
+from grouping.config_doc import GroupingConfigDoc
+from grouping.doc_module import _group_page, _params_dict, _zero_derived
+
+
+def _sample_result() -> GroupPageResult:
+    bbox = GroupBBox(x0=1, y0=2, x1=30, y1=12)
+    tok = GroupTokenRef(token_id="p001_t000000", text="Héllo", bbox=bbox, confidence=0.5)
+    line = GroupLine(line_id="p001_l0000", page_num=1, bbox=bbox, tokens=[tok], text="Héllo")
+    block = GroupBlock(block_id="p001_b0000", page_num=1, bbox=bbox, line_ids=[line.line_id], text="Héllo")
+    return GroupPageResult(
+        ok=False,
+        page_num=1,
+        source_ocr_relpath="artifacts/ocr/doc/page_001.ocr.json",
+        lines=[line],
+        blocks=[block],
+        errors=[GroupError(code="GROUP_X", message="m", detail={"z": 1, "a": None})],
+        meta={"params": {"b": 2, "a": 1}, "counts": {"lines": 1}},
+    )
+
+
+def _sample_doc_result() -> GroupDocResult:
+    err = GroupError(code="GROUP_X", message="m", detail={1: "non-str key"})
+    ref = GroupDocPageRef(page_num=1, source_ocr_relpath="a.json", group_out_relpath="b.json", ok=False, errors=[err])
+    return GroupDocResult(
+        doc_id="doc",
+        ok=False,
+        source_ocr_doc_ledger_relpath="ledger.json",
+        pages=[ref],
+        errors=[err],
+        meta={"pages_total": 1},
+    )
+
+
+def _key_paths(obj: Any, prefix: str = "") -> list[str]:
+    # Every key in serialized (document) order, as dotted paths; lists contribute their first item.
+    out: list[str] = []
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            path = f"{prefix}.{k}" if prefix else k
+            out.append(path)
+            out.extend(_key_paths(v, path))
+    elif isinstance(obj, list) and obj:
+        out.extend(_key_paths(obj[0], prefix + "[]"))
+    return out
+
+
+def _bbox_paths(prefix: str) -> list[str]:
+    return [prefix] + [f"{prefix}.{k}" for k in ("x0", "y0", "x1", "y1")]
+
+
+# Key order is part of the Stage 2 artifact format (docs/architecture/02_PIPELINE_DATA_FLOW.md):
+# reordering a contract field or a meta dict must show up here as a format change.
+_PAGE_KEY_ORDER = [
+    "ok",
+    "page_num",
+    "source_ocr_relpath",
+    "lines",
+    "lines[].line_id",
+    "lines[].page_num",
+    *_bbox_paths("lines[].bbox"),
+    "lines[].tokens",
+    "lines[].tokens[].token_id",
+    "lines[].tokens[].text",
+    *_bbox_paths("lines[].tokens[].bbox"),
+    "lines[].tokens[].confidence",
+    "lines[].text",
+    "blocks",
+    "blocks[].block_id",
+    "blocks[].page_num",
+    *_bbox_paths("blocks[].bbox"),
+    "blocks[].line_ids",
+    "blocks[].text",
+    "errors",
+    "meta",
+    "meta.stage",
+    "meta.mode",
+    "meta.algorithm",
+    "meta.version",
+    "meta.params",
+    "meta.params.confidence_floor",
+    "meta.params.drop_whitespace_tokens",
+    "meta.params.repair_bboxes",
+    "meta.params.line_y_tol_k",
+    "meta.params.min_line_y_tol_px",
+    "meta.params.block_gap_k",
+    "meta.params.min_block_gap_px",
+    "meta.params.block_overlap_threshold",
+    "meta.params.include_text_fields",
+    "meta.params.emit_regions",
+    "meta.derived",
+    "meta.derived.median_token_height_px",
+    "meta.derived.line_y_tol_px",
+    "meta.derived.refined_bins",
+    "meta.derived.median_line_height_px",
+    "meta.derived.median_line_gap_px",
+    "meta.derived.gap_threshold_px",
+    "meta.derived.overlap_threshold",
+    "meta.counts",
+    "meta.counts.tokens_in",
+    "meta.counts.tokens_used",
+    "meta.counts.lines",
+    "meta.counts.blocks",
+    "meta.counts.dropped_tokens_count",
+    "meta.counts.warnings_count",
+    "meta.dropped_tokens",
+    "meta.dropped_tokens[].token_id",
+    "meta.dropped_tokens[].reason",
+    "meta.warnings",
+    "meta.warnings[].code",
+    "meta.warnings[].message",
+    "meta.warnings[].detail",
+    "meta.warnings[].detail.token_id",
+    *_bbox_paths("meta.warnings[].detail.before"),
+    *_bbox_paths("meta.warnings[].detail.after"),
+]
+
+_DOC_KEY_ORDER = [
+    "doc_id",
+    "ok",
+    "source_ocr_doc_ledger_relpath",
+    "pages",
+    "pages[].page_num",
+    "pages[].source_ocr_relpath",
+    "pages[].group_out_relpath",
+    "pages[].ok",
+    "pages[].errors",
+    "pages[].errors[].code",
+    "pages[].errors[].message",
+    "pages[].errors[].detail",
+    "pages[].errors[].detail.1",
+    "errors",
+    "errors[].code",
+    "errors[].message",
+    "errors[].detail",
+    "errors[].detail.1",
+    "meta",
+    "meta.pages_total",
+]
+
+
+class TestGroupingArtifactsSerialization(unittest.TestCase):
+    def test_hand_rolled_to_dict_matches_asdict(self) -> None:
+        self.assertEqual(_sample_result().to_dict(), dataclasses.asdict(_sample_result()))
+        self.assertEqual(_sample_doc_result().to_dict(), dataclasses.asdict(_sample_doc_result()))
+
+    def test_to_dict_copies_unless_told_not_to(self) -> None:
+        page, doc = _sample_result(), _sample_doc_result()
+        out = page.to_dict()
+        out["blocks"][0]["line_ids"].append("x")
+        out["meta"]["params"]["b"] = 99
+        out["errors"][0]["detail"]["z"] = 2
+        doc_out = doc.to_dict()
+        doc_out["meta"]["pages_total"] = 5
+        doc_out["pages"][0]["errors"][0]["detail"][1] = "changed"
+        self.assertEqual(page, _sample_result())
+        self.assertEqual(doc, _sample_doc_result())
+
+        shared = page.to_dict(copy=False)
+        self.assertIs(shared["meta"], page.meta)
+        self.assertIs(shared["blocks"][0]["line_ids"], page.blocks[0].line_ids)
+        self.assertIs(shared["errors"][0]["detail"], page.errors[0].detail)
+        self.assertIs(doc.to_dict(copy=False)["meta"], doc.meta)
+
+    def test_insertion_order_output_matches_sorted_content(self) -> None:
+        result = _sample_result()
+        text = artifacts.serialize_group_page_result(result)
+
+        # Unsorted output carries exactly the same content as the previous sorted form.
+        self.assertEqual(json.loads(text), result.to_dict())
+        self.assertEqual(
+            json.dumps(json.loads(text), sort_keys=True),
+            json.dumps(result.to_dict(), sort_keys=True),
+        )
+        self.assertLess(text.index('"ok"'), text.index('"lines"'))
+
+    def test_serialized_key_order_is_pinned(self) -> None:
+        cfg = GroupingConfigDoc()
+        with tempfile.TemporaryDirectory() as td:
+            repo_root = Path(td).resolve()
+            tokens = [
+                # Swapped x endpoints (repaired -> warning) and a whitespace token (dropped).
+                {"token_id": "a", "text": "x", "bbox": {"x0": 30, "y0": 2, "x1": 1, "y1": 12}, "confidence": 0.5},
+                {"token_id": "b", "text": " ", "bbox": {"x0": 1, "y0": 2, "x1": 30, "y1": 12}, "confidence": 0.5},
+            ]
+            (repo_root / "page_001.ocr.json").write_text(
+                json.dumps({"pages": [{"page_num": 1, "tokens": tokens}]}), encoding="utf-8"
+            )
+            page = _group_page(
+                page_num=1,
+                ocr_out_relpath="page_001.ocr.json",
+                repo_root=repo_root,
+                cfg=cfg,
+                params=_params_dict(cfg),
+                zero_derived=_zero_derived(cfg),
+            )
+        saved = (artifacts.orjson, doc_artifacts.orjson)
+        try:
+            for backend in (saved, (None, None)):
+                artifacts.orjson, doc_artifacts.orjson = backend
+                # json.loads keeps keys in document order.
+                page_json = json.loads(artifacts.serialize_group_page_result(page))
+                doc_json = json.loads(doc_artifacts.serialize_group_doc_result(_sample_doc_result()))
+                self.assertEqual(_key_paths(page_json), _PAGE_KEY_ORDER)
+                self.assertEqual(_key_paths(doc_json), _DOC_KEY_ORDER)
+        finally:
+            artifacts.orjson, doc_artifacts.orjson = saved
+
+    def test_orjson_and_stdlib_backends_emit_identical_bytes(self) -> None:
+        if artifacts.orjson is None:
+            self.skipTest("orjson not installed")
+        result = _sample_result()
+        fast = artifacts.serialize_group_page_result(result)
+        saved = artifacts.orjson
+        artifacts.orjson = None
+        try:
+            slow = artifacts.serialize_group_page_result(result)
+        finally:
+            artifacts.orjson = saved
+        self.assertEqual(fast, slow)
+
+    def test_doc_manifest_backends_emit_identical_bytes(self) -> None:
+        if doc_artifacts.orjson is None:
+            self.skipTest("orjson not installed")
+        result = _sample_doc_result()
+        fast = doc_artifacts.serialize_group_doc_result(result)
+        saved = doc_artifacts.orjson
+        doc_artifacts.orjson = None
+        try:
+            slow = doc_artifacts.serialize_group_doc_result(result)
+        finally:
+            doc_artifacts.orjson = saved
+        self.assertEqual(fast, slow)
+
+    def test_float_values_on_both_backends(self) -> None:
+        if artifacts.orjson is None:
+            self.skipTest("orjson not installed")
+
+        def both(confidence: float) -> tuple[str, str]:
+            bbox = GroupBBox(x0=1, y0=2, x1=30, y1=12)
+            tok = GroupTokenRef(token_id="t", text="x", bbox=bbox, confidence=confidence)
+            line = GroupLine(line_id="p001_l0000", page_num=1, bbox=bbox, tokens=[tok], text="x")
+            result = dataclasses.replace(_sample_result(), lines=[line])
+            fast = artifacts.serialize_group_page_result(result)
+            saved = artifacts.orjson
+            artifacts.orjson = None
+            try:
+                slow = artifacts.serialize_group_page_result(result)
+            finally:
+                artifacts.orjson = saved
+            return fast, slow
+
+        # Plain decimal spellings (OCR confidences, thresholds) come out byte-identical.
+        for value in (0.0, 1.0, 0.5, 0.91, 0.123456789, 0.0001):
+            fast, slow = both(value)
+            self.assertEqual(fast, slow)
+        # Exponent forms differ in spelling only; the parsed content is the same.
+        for value in (1e-05, 1e-07, 2.5e-320):
+            fast, slow = both(value)
+            self.assertEqual(json.loads(fast), json.loads(slow))
+        self.assertIn('"confidence": 1e-05', both(1e-05)[1])
+        self.assertIn('"confidence": 0.00001', both(1e-05)[0])
+
+        # Non-finite floats: orjson writes null, the stdlib path refuses instead of writing NaN.
+        bbox = GroupBBox(x0=1, y0=2, x1=30, y1=12)
+        nan_tok = GroupTokenRef(token_id="t", text="x", bbox=bbox, confidence=float("nan"))
+        nan_line = GroupLine(line_id="p001_l0000", page_num=1, bbox=bbox, tokens=[nan_tok], text="x")
+        nan_result = dataclasses.replace(_sample_result(), lines=[nan_line])
+        self.assertIn('"confidence": null', artifacts.serialize_group_page_result(nan_result))
+        saved = artifacts.orjson
+        artifacts.orjson = None
+        try:
+            with tempfile.TemporaryDirectory() as td:
+                out = Path(td) / "page_001.group.json"
+                with self.assertRaises(ValueError):
+                    artifacts.write_group_json_artifact(result=nan_result, out_file=out)
+                self.assertFalse(out.exists())
+        finally:
+            artifacts.orjson = saved
+
+    def test_non_finite_confidence_is_loaded_as_missing(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            repo_root = Path(td).resolve()
+            bbox = {"x0": 1, "y0": 2, "x1": 30, "y1": 12}
+            tokens = [
+                {"token_id": "a", "text": "x", "bbox": bbox, "confidence": float("nan")},
+                {"token_id": "b", "text": "y", "bbox": bbox, "confidence": "inf"},
+                {"token_id": "c", "text": "z", "bbox": bbox, "confidence": 0.5},
+            ]
+            (repo_root / "page_001.ocr.json").write_text(
+                json.dumps({"pages": [{"page_num": 1, "tokens": tokens}]}), encoding="utf-8"
+            )
+            result = _group_page(
+                page_num=1,
+                ocr_out_relpath="page_001.ocr.json",
+                repo_root=repo_root,
+                cfg=GroupingConfigDoc(),
+                params={},
+                zero_derived={},
+            )
+        confidences = {t.token_id: t.confidence for l in result.lines for t in l.tokens}
+        self.assertEqual(confidences, {"a": None, "b": None, "c": 0.5})
+
+    def test_written_files_match_serialized_text_on_both_backends(self) -> None:
+        page, doc = _sample_result(), _sample_doc_result()
+        saved = (artifacts.orjson, doc_artifacts.orjson)
+        try:
+            for backend in (saved, (None, None)):
+                artifacts.orjson, doc_artifacts.orjson = backend
+                with tempfile.TemporaryDirectory() as td:
+                    page_out = Path(td) / "page_001.group.json"
+                    doc_out = Path(td) / "group_doc.json"
+                    artifacts.write_group_json_artifact(result=page, out_file=page_out)
+                    doc_artifacts.write_group_doc_manifest_json(result=doc, out_path=doc_out)
+                    self.assertEqual(page_out.read_bytes(), artifacts.serialize_group_page_result(page).encode("utf-8"))
+                    self.assertEqual(doc_out.read_bytes(), doc_artifacts.serialize_group_doc_result(doc).encode("utf-8"))
+        finally:
+            artifacts.orjson, doc_artifacts.orjson = saved
+
+    def test_batch_write_matches_single_writes(self) -> None:
+        result = _sample_result()
+        with tempfile.TemporaryDirectory() as td:
+            outs = [Path(td) / "doc" / f"page_{i:03d}.group.json" for i in range(1, 4)]
+            artifacts.write_group_json_artifacts_batch([(result, p) for p in outs])
+            expected = artifacts.serialize_group_page_result(result)
+            for p in outs:
+                self.assertEqual(p.read_text(encoding="utf-8"), expected)
+
+            # Lazily consumed: a generator longer than the in-flight window is fully written.
+            lazy = [Path(td) / "lazy" / f"page_{i:03d}.group.json" for i in range(1, 10)]
+            artifacts.write_group_json_artifacts_batch((result, p) for p in lazy)
+            self.assertEqual([p.read_text(encoding="utf-8") for p in lazy], [expected] * len(lazy))
+
+            blocker = Path(td) / "blocker"
+            blocker.write_text("", encoding="utf-8")
+            with self.assertRaises(OSError):
+                artifacts.write_group_json_artifacts_batch([(result, outs[0]), (result, blocker / "x.json")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -235,6 +235,84 @@ class TestGroupingDocFromOcrDocLedger(unittest.TestCase):
         self.assertTrue(r1.pages[0].group_out_relpath.endswith("/page_001.group.json"))
         self.assertTrue(r1.pages[1].group_out_relpath.endswith("/page_002.group.json"))
 
+        # Worker processes write the same page artifacts and return refs in page order.
+        page_bytes = [(repo_root / p.group_out_relpath).read_bytes() for p in r1.pages]
+        shutil.rmtree(out_dir_doc)
+        r3 = run_group_on_ocr_doc_ledger(
+            ocr_doc_ledger=ledger.relative_to(repo_root),
+            out_dir=Path("artifacts/grouping"),
+            out_doc_manifest=root / "group_doc.json",
+            jobs=2,
+        )
+        self.assertEqual(serialize_group_doc_result(r1), serialize_group_doc_result(r3))
+        self.assertEqual([(repo_root / p.group_out_relpath).read_bytes() for p in r3.pages], page_bytes)
+
+    def test_worker_chunks_match_in_process_bytes(self) -> None:
+        repo_root = Path(__file__).resolve().parents[1]
+        root = repo_root / "artifacts" / "_test_grouping_doc_chunks"
+        if root.exists():
+            shutil.rmtree(root)
+        root.mkdir(parents=True, exist_ok=True)
+
+        doc_id = "doc_test_chunks"
+        out_dir_doc = repo_root / "artifacts" / "grouping" / doc_id
+        if out_dir_doc.exists():
+            shutil.rmtree(out_dir_doc)
+
+        # 20 pages with jobs=2 -> chunksize 20 // (2 * 4) = 2, so workers get multi-page tasks.
+        # Every third page has swapped bbox endpoints (repair warnings); page 7 points at a
+        # missing OCR file (per-page error ref).
+        n_pages = 20
+        (root / "ocr" / doc_id).mkdir(parents=True, exist_ok=True)
+        ledger_pages = []
+        for page_num in range(1, n_pages + 1):
+            page_file = root / "ocr" / doc_id / f"page_{page_num:03d}.ocr.json"
+            tokens = []
+            for i in range(6):
+                x0, y0 = 10 + 40 * (i % 3), 10 + 30 * (i // 3) + page_num
+                x1, y1 = x0 + 30, y0 + 20
+                if page_num % 3 == 0 and i % 2 == 0:
+                    x0, x1 = x1, x0
+                tokens.append(
+                    {
+                        "token_id": f"p{page_num:03d}_t{i:06d}",
+                        "page_num": page_num,
+                        "text": f"w{page_num}_{i}",
+                        "bbox": {"x0": x0, "y0": y0, "x1": x1, "y1": y1},
+                        "confidence": 0.5 + i / 20,
+                    }
+                )
+            if page_num != 7:
+                payload = {"ok": True, "pages": [{"page_num": page_num, "tokens": tokens}], "errors": [], "meta": {}}
+                page_file.write_text(json.dumps(payload) + "\n", encoding="utf-8")
+            ocr_out_relpath = page_file.relative_to(repo_root).as_posix()
+            ledger_pages.append({"page_num": page_num, "ocr_out_relpath": ocr_out_relpath, "ok": True, "errors": []})
+        ledger = root / "ocr_doc.json"
+        ledger_payload = {"doc_id": doc_id, "ok": True, "pages": ledger_pages, "errors": [], "meta": {}}
+        ledger.write_text(json.dumps(ledger_payload) + "\n", encoding="utf-8")
+
+        def run(jobs: int) -> tuple[list[bytes], bytes]:
+            if out_dir_doc.exists():
+                shutil.rmtree(out_dir_doc)
+            r = run_group_on_ocr_doc_ledger(
+                ocr_doc_ledger=ledger.relative_to(repo_root),
+                out_dir=Path("artifacts/grouping"),
+                out_doc_manifest=root / f"group_doc_{jobs}.json",
+                jobs=jobs,
+            )
+            self.assertEqual([p.page_num for p in r.pages], list(range(1, n_pages + 1)))
+            self.assertEqual([p.page_num for p in r.pages if not p.ok], [7])
+            pages = [(repo_root / p.group_out_relpath).read_bytes() for p in r.pages]
+            return pages, serialize_group_doc_result(r).encode("utf-8")
+
+        pages_1, doc_1 = run(1)
+        pages_2, doc_2 = run(2)
+
+        self.assertEqual(sum(b"GROUP_BBOX_REPAIRED" in b for b in pages_1), n_pages // 3)
+        self.assertEqual(pages_2, pages_1)
+        self.assertEqual(doc_2, doc_1)
+        self.assertEqual((root / "group_doc_2.json").read_bytes(), (root / "group_doc_1.json").read_bytes())
+
     def test_line_ids_assigned_in_reading_order(self) -> None:
         repo_root = Path(__file__).resolve().parents[1]
         root = repo_root / "artifacts" / "_test_grouping_doc_line_ids"
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import unittest
+
+from contracts.grouping_doc_mode import GroupBBox, GroupTokenRef
+from grouping.config_doc import GroupingConfigDoc
+from grouping.doc_module import group_tokens_into_lines
+
+
+def _tok(tid: str, x0: int, y0: int) -> GroupTokenRef:
+    return GroupTokenRef(token_id=tid, text=tid, bbox=GroupBBox(x0=x0, y0=y0, x1=x0 + 8, y1=y0 + 10), confidence=None)
+
+
+class TestGroupingDocLineBinning(unittest.TestCase):
+    def test_bin_reference_stays_at_first_token(self) -> None:
+        # Median height 10, k=0.4 -> tolerance 4 px. y0=3 joins the y0=0 line; y0=6 is 6 px from
+        # that line's frozen reference and opens a new one even though it is 3 px from y0=3.
+        cfg = GroupingConfigDoc(line_y_tol_k=0.4, min_line_y_tol_px=0)
+        tokens = [_tok("c", 0, 6), _tok("b", 20, 3), _tok("a", 0, 0), _tok("d", 40, 7)]
+
+        lines, meta = group_tokens_into_lines(tokens=tokens, page_num=1, cfg=cfg)
+
+        self.assertEqual(meta["line_y_tol_px"], 4)
+        self.assertEqual([[t.token_id for t in ln.tokens] for ln in lines], [["a", "b"], ["c", "d"]])
+        self.assertEqual([ln.line_id for ln in lines], ["p001_l0000", "p001_l0001"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,8 +5,9 @@ import shutil
 import unittest
 from pathlib import Path
 
+from contracts.grouping_doc_mode import GroupBBox, GroupTokenRef
 from grouping.config_doc import GroupingConfigDoc
-from grouping.doc_module import run_group_on_ocr_doc_ledger
+from grouping.doc_module import _preprocess_tokens, _stable_json, run_group_on_ocr_doc_ledger
 
 
 class TestGroupingDocTokenPreprocessing(unittest.TestCase):
@@ -166,6 +167,22 @@ class TestGroupingDocTokenPreprocessing(unittest.TestCase):
         # At least one bbox repaired warning.
         self.assertTrue(any(w["code"] == "GROUP_BBOX_REPAIRED" for w in warnings))
 
+    def test_repair_warnings_keep_stable_json_order(self) -> None:
+        # Ordering is by the sorted-keys JSON of `detail` (so "after" coordinates, compared as
+        # text, lead); ids with quotes/non-ASCII check the escaping of the cheap sort key.
+        boxes = [(5, 40, 0, 30), (100, 9, 20, 2), (-3, 8, -9, 1), (8, 7, 3, 1)]
+        ids = ['t"1', "tÄ", "t\\3", "t4"]
+        tokens = [
+            GroupTokenRef(token_id=tid, text="x", bbox=GroupBBox(x0=a, y0=b, x1=c, y1=d), confidence=None)
+            for tid, (a, b, c, d) in zip(ids, boxes)
+        ]
+        _, _, warnings = _preprocess_tokens(tokens=tokens, cfg=GroupingConfigDoc())
+
+        expected = sorted(warnings, key=lambda w: (w["code"], w["message"], _stable_json(w["detail"])))
+        self.assertEqual(len(warnings), 4)
+        self.assertEqual(warnings, expected)
+        self.assertEqual([w["detail"]["token_id"] for w in warnings], ["t\\3", 't"1', "tÄ", "t4"])
+
 
 if __name__ == "__main__":
     unittest.main()
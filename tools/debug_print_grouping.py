@@ -33,15 +33,27 @@ Report writer (optional)
   --report-dir DIR       Output directory for report (default: artifacts/grouping_visualizations)
   --report-name NAME     Optional explicit report filename (no path)
   --no-ascii             Skip ASCII map output (useful with --write-report)
+  --jobs N               Render token grids / ASCII maps in N worker processes (0: one per CPU)
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import mmap
+import os
+import sys
 from dataclasses import dataclass
+from json.encoder import encode_basestring as _json_str
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
 
 
 # ----------------------------
@@ -55,7 +67,21 @@ def _repo_root() -> Path:
 
 
 def _read_json(p: Path) -> Any:
-    return json.loads(p.read_text(encoding="utf-8"))
+    # Bytes in, no separate utf-8 decode pass; orjson parses large OCR/group artifacts much faster.
+    # Anything orjson rejects is re-parsed with the stdlib (as in grouping.doc_module._load_json),
+    # so what loads, and the repr(e) shown for pages that do not, is the same with or without it.
+    if orjson is not None:
+        with open(p, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap rejects empty files; this is the error json.loads(b"") raises.
+                raise json.JSONDecodeError("Expecting value", "", 0)
+            # orjson parses straight out of the page-cache mapping: no heap copy of the file.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                try:
+                    return orjson.loads(view)
+                except orjson.JSONDecodeError:
+                    pass
+    return json.loads(p.read_bytes())
 
 
 def _stable_json(x: Any) -> str:
@@ -127,9 +153,19 @@ def _indent(n: int) -> str:
     return " " * int(n)
 
 
+_BBOX_ITEMS = itemgetter("x0", "y0", "x1", "y1")
+
+
 def _fmt_bbox(bb_dict: Any) -> str:
     if not isinstance(bb_dict, dict):
         return "?,?,?,?"
+    try:
+        # C-level `%d` formatting of the four values (truncates floats exactly like int()).
+        return "%d,%d,%d,%d" % _BBOX_ITEMS(bb_dict)
+    except TypeError:
+        pass  # e.g. numeric strings: int() below accepts them, `%d` does not
+    except Exception:
+        return "?,?,?,?"
     try:
         return f"{int(bb_dict['x0'])},{int(bb_dict['y0'])},{int(bb_dict['x1'])},{int(bb_dict['y1'])}"
     except Exception:
@@ -138,9 +174,11 @@ def _fmt_bbox(bb_dict: Any) -> str:
 
 def _fmt_text_one_line(s: Any) -> str:
     # Preserve original text exactly, but keep the report readable and single-line per token.
+    # `_json_str` is exactly what json.dumps(s, ensure_ascii=False) returns for a str, without
+    # building a JSONEncoder per call (this runs once per token in the report).
     if not isinstance(s, str):
         s = "" if s is None else str(s)
-    return json.dumps(s, ensure_ascii=False)
+    return _json_str(s)
 
 
 def _safe_bbox_key(bb_dict: Any) -> Tuple[int, int, int, int]:
@@ -228,7 +266,7 @@ def _compute_out_base(*, repo_root: Path, base_dir_arg: str, doc_id: str) -> Pat
 # Geometry + rendering
 # ----------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BBox:
     x0: int
     y0: int
@@ -348,11 +386,12 @@ def render_ascii_map(
     show_blocks: bool,
     show_lines: bool,
     show_tokens: bool,
+    bounds: Optional[Tuple[int, int, int, int]] = None,
 ) -> str:
     canvas = [[" " for _ in range(width)] for __ in range(height)]
 
-    bbs_all = _collect_all_bboxes(page_payload)
-    bounds = _page_bounds(bbs_all)
+    if bounds is None:
+        bounds = _page_bounds(_collect_all_bboxes(page_payload))
 
     # Draw in increasing “importance” so smaller things can sit on top.
     # Blocks: '#', Lines: '-', Tokens: '.'
@@ -394,27 +433,29 @@ def print_page_summary(page_payload: Dict[str, Any], *, show_text: bool, max_sni
     page_num = page_payload.get("page_num")
     meta = page_payload.get("meta") or {}
 
-    print(f"\n=== Page {page_num} ===  ok={ok}")
+    # One write per page instead of one print() per line.
+    buf: List[str] = []
+    buf.append(f"\n=== Page {page_num} ===  ok={ok}")
     if not ok:
         errs = page_payload.get("errors") or []
         if errs:
-            print("Errors:")
+            buf.append("Errors:")
             for e in errs:
                 code = (e or {}).get("code")
                 msg = (e or {}).get("message")
-                print(f"  - {code}: {msg}")
+                buf.append(f"  - {code}: {msg}")
         else:
-            print("Errors: <none>")
+            buf.append("Errors: <none>")
 
     counts = meta.get("counts") or {}
     derived = meta.get("derived") or {}
     warnings = meta.get("warnings") or []
     dropped = meta.get("dropped_tokens") or []
 
-    print("Counts:")
+    buf.append("Counts:")
     for k in ["tokens_in", "tokens_used", "lines", "blocks", "dropped_tokens_count", "warnings_count"]:
         if k in counts:
-            print(f"  {k}: {counts[k]}")
+            buf.append(f"  {k}: {counts[k]}")
 
     # Derived parameters (print the most informative ones if present)
     if isinstance(derived, dict) and derived:
@@ -429,56 +470,64 @@ def print_page_summary(page_payload: Dict[str, Any], *, show_text: bool, max_sni
         ]
         show = [k for k in keys_pref if k in derived]
         if show:
-            print("Derived:")
+            buf.append("Derived:")
             for k in show:
-                print(f"  {k}: {derived[k]}")
+                buf.append(f"  {k}: {derived[k]}")
 
     if dropped:
-        print(f"Dropped tokens ({len(dropped)}):")
+        buf.append(f"Dropped tokens ({len(dropped)}):")
         for d in dropped[:25]:
-            print(f"  - {d.get('token_id')}: {d.get('reason')}")
+            buf.append(f"  - {d.get('token_id')}: {d.get('reason')}")
         if len(dropped) > 25:
-            print(f"  ... ({len(dropped) - 25} more)")
+            buf.append(f"  ... ({len(dropped) - 25} more)")
 
     if warnings:
-        print(f"Warnings ({len(warnings)}):")
+        buf.append(f"Warnings ({len(warnings)}):")
         for w in warnings[:15]:
-            print(f"  - {w.get('code')}: {w.get('message')}")
+            buf.append(f"  - {w.get('code')}: {w.get('message')}")
         if len(warnings) > 15:
-            print(f"  ... ({len(warnings) - 15} more)")
+            buf.append(f"  ... ({len(warnings) - 15} more)")
 
     if show_text:
         # Lines
         lines = page_payload.get("lines") or []
         if lines:
-            print("\nLine text snippets:")
+            buf.append("\nLine text snippets:")
             for ln in lines[:50]:
                 lid = ln.get("line_id")
                 txt = ln.get("text") or ""
                 if txt.strip():
-                    print(f"  [{lid}] {_truncate(txt.replace('\\n', ' '), max_snippet)}")
+                    one_line = txt.replace("\n", " ")
+                    buf.append(f"  [{lid}] {_truncate(one_line, max_snippet)}")
             if len(lines) > 50:
-                print(f"  ... ({len(lines) - 50} more lines)")
+                buf.append(f"  ... ({len(lines) - 50} more lines)")
 
         # Blocks
         blocks = page_payload.get("blocks") or []
         if blocks:
-            print("\nBlock text snippets:")
+            buf.append("\nBlock text snippets:")
             for bl in blocks[:25]:
                 bid = bl.get("block_id")
                 txt = bl.get("text") or ""
                 if txt.strip():
-                    print(f"  [{bid}] {_truncate(txt.replace('\\n', ' '), max_snippet)}")
+                    one_line = txt.replace("\n", " ")
+                    buf.append(f"  [{bid}] {_truncate(one_line, max_snippet)}")
             if len(blocks) > 25:
-                print(f"  ... ({len(blocks) - 25} more blocks)")
+                buf.append(f"  ... ({len(blocks) - 25} more blocks)")
+
+    sys.stdout.write("\n".join(buf) + "\n")
 
 
-def load_pages_from_input(input_path: Path) -> Tuple[str, Any, List[Tuple[int, Dict[str, Any]]]]:
+def load_pages_from_input(
+    input_path: Path, *, page_filter: Optional[int] = None
+) -> Tuple[str, Any, List[Tuple[int, Dict[str, Any]]]]:
     """
     Returns (kind, input_payload, pages)
       kind: 'doc' or 'page'
       input_payload: raw JSON payload loaded from input_path
       pages: list of (page_num, page_payload)
+
+    For doc manifests, `page_filter` limits which per-page artifacts are read at all.
     """
     repo_root = _repo_root()
     p_abs = _as_abs(repo_root, input_path)
@@ -493,6 +542,8 @@ def load_pages_from_input(input_path: Path) -> Tuple[str, Any, List[Tuple[int, D
             rel = pe.get("group_out_relpath")
             if not isinstance(page_num, int) or not isinstance(rel, str):
                 continue
+            if page_filter is not None and page_num != page_filter:
+                continue
             page_path = _as_abs(repo_root, Path(rel))
             try:
                 page_payload = _read_json(page_path)
@@ -560,27 +611,17 @@ def _resolve_doc_id(*, kind: str, input_path: Path, input_payload: Any, pages: L
 
 def _extract_tokens_for_grid(page_payload: Dict[str, Any]) -> List[Dict[str, Any]]:
     # Prefer tokens under grouped lines (matches tokens_used set).
-    toks: List[Dict[str, Any]] = []
+    # Token dicts are returned as-is (read-only here); one filtered list, sorted in place.
     lines_any = page_payload.get("lines") or []
     if not isinstance(lines_any, list):
         return []
-    for ln in lines_any:
-        if not isinstance(ln, dict):
-            continue
-        tokens_any = ln.get("tokens") or []
-        if not isinstance(tokens_any, list):
-            continue
-        for t in tokens_any:
-            if not isinstance(t, dict):
-                continue
-            toks.append(
-                {
-                    "token_id": t.get("token_id"),
-                    "text": t.get("text"),
-                    "bbox": t.get("bbox"),
-                    "confidence": t.get("confidence"),
-                }
-            )
+    toks: List[Dict[str, Any]] = [
+        t
+        for ln in lines_any
+        if isinstance(ln, dict) and isinstance(tokens_any := ln.get("tokens") or [], list)
+        for t in tokens_any
+        if isinstance(t, dict)
+    ]
     toks.sort(key=_token_sort_key)
     return toks
 
@@ -593,10 +634,11 @@ def render_token_text_grid(
     max_token_len: int,
     collision: str,
     show_conf: bool,
+    bounds: Optional[Tuple[int, int, int, int]] = None,
 ) -> str:
     page_num = page_payload.get("page_num")
-    bbs_all = _collect_all_bboxes(page_payload)
-    bounds = _page_bounds(bbs_all)
+    if bounds is None:
+        bounds = _page_bounds(_collect_all_bboxes(page_payload))
     x0, y0, x1, y1 = bounds
 
     W = max(10, int(width))
@@ -720,8 +762,7 @@ def render_token_text_grid(
                 continue
 
             if collision == "replace":
-                old_spans = [spans.get(sid) for sid in collided]
-                old_spans = [o for o in old_spans if o is not None]
+                old_spans = [o for sid in collided if (o := spans.get(sid)) is not None]
                 if old_spans and all(_better(new=new_span, old=o) for o in old_spans):
                     for sid in collided:
                         _clear_span(sid)
@@ -744,6 +785,45 @@ def render_token_text_grid(
     return header + "\n" + top + "\n" + "\n".join(rows) + "\n" + bot + "\n"
 
 
+def _render_one(render: Callable[..., str], page_payload: Dict[str, Any], bounds: Any) -> str:
+    return render(page_payload, bounds=bounds)
+
+
+def _render_pages(
+    render: Callable[..., str],
+    pages: List[Tuple[int, Dict[str, Any]]],
+    *,
+    page_bounds: Optional[List[Tuple[int, int, int, int]]],
+    jobs: int,
+) -> List[str]:
+    """
+    Render every page with `render(page_payload, bounds=...)`, in page order.
+    With jobs > 1 the pages are spread over worker processes (rendering is pure CPU work);
+    jobs <= 0 means one worker per CPU, as in `sq-grouping --jobs`.
+    """
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    payloads = [pp for _, pp in pages]
+    bounds_list: List[Any] = list(page_bounds) if page_bounds is not None else [None] * len(payloads)
+    if jobs <= 1 or len(payloads) < 2:
+        return [_render_one(render, pp, b) for pp, b in zip(payloads, bounds_list)]
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(jobs, len(payloads))
+    # Spawned, not forked, like the grouping page pool (grouping.doc_module).
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as ex:
+        return list(
+            ex.map(
+                _render_one,
+                [render] * len(payloads),
+                payloads,
+                bounds_list,
+                chunksize=max(1, len(payloads) // (workers * 4)),
+            )
+        )
+
+
 def write_token_grid_files(
     *,
     out_base: Path,
@@ -753,20 +833,23 @@ def write_token_grid_files(
     max_token_len: int,
     collision: str,
     show_conf: bool,
+    page_bounds: Optional[List[Tuple[int, int, int, int]]] = None,
+    jobs: int = 1,
 ) -> List[Path]:
     out_base.mkdir(parents=True, exist_ok=True)
+    render = functools.partial(
+        render_token_text_grid,
+        width=grid_width,
+        height=grid_height,
+        max_token_len=max_token_len,
+        collision=collision,
+        show_conf=show_conf,
+    )
+    contents = _render_pages(render, pages, page_bounds=page_bounds, jobs=jobs)
     written: List[Path] = []
-    for page_num, page_payload in pages:
+    for (page_num, _), content in zip(pages, contents):
         fn = out_base / f"page_{page_num:03d}_token_grid.txt"
         fn.parent.mkdir(parents=True, exist_ok=True)
-        content = render_token_text_grid(
-            page_payload,
-            width=grid_width,
-            height=grid_height,
-            max_token_len=max_token_len,
-            collision=collision,
-            show_conf=show_conf,
-        )
         fn.write_text(content.rstrip() + "\n", encoding="utf-8")
         written.append(fn)
     return written
@@ -855,17 +938,18 @@ def build_report_text(*, input_path: Path, kind: str, pages: List[Tuple[int, Dic
         # Build indices for matching.
         lines_any = page_payload.get("lines") or []
         blocks_any = page_payload.get("blocks") or []
-        page_lines: List[Dict[str, Any]] = [ln for ln in (lines_any or []) if isinstance(ln, dict)]
         page_blocks: List[Dict[str, Any]] = [bl for bl in (blocks_any or []) if isinstance(bl, dict)]
 
+        # Index lines by line_id straight from the raw list (no intermediate filtered copy).
         lines_by_id: Dict[str, Dict[str, Any]] = {}
-        for ln in page_lines:
+        for ln in lines_any or []:
+            if not isinstance(ln, dict):
+                continue
             lid = ln.get("line_id")
             if isinstance(lid, str) and lid:
                 lines_by_id[lid] = ln
 
         page_blocks.sort(key=_block_sort_key)
-        page_lines_sorted = sorted(page_lines, key=_line_sort_key)
 
         lines_out.append(f"{_indent(2)}Blocks: {len(page_blocks)}")
         referenced_line_ids: set[str] = set()
@@ -899,12 +983,15 @@ def build_report_text(*, input_path: Path, kind: str, pages: List[Tuple[int, Dic
                 # No line_ids field: print block as-is only (no heuristics).
                 pass
 
-        # Orphan lines (not referenced by any block line_ids).
+        # Orphan lines (not referenced by any block line_ids). Filter first, then sort only those.
         orphan_lines: List[Dict[str, Any]] = []
-        for ln in page_lines_sorted:
+        for ln in lines_any or []:
+            if not isinstance(ln, dict):
+                continue
             lid = ln.get("line_id")
             if isinstance(lid, str) and lid and lid not in referenced_line_ids:
                 orphan_lines.append(ln)
+        orphan_lines.sort(key=_line_sort_key)
         if orphan_lines:
             lines_out.append(f"{_indent(2)}Orphan lines: {len(orphan_lines)}")
             for ln in orphan_lines:
@@ -928,14 +1015,13 @@ def _append_line_detail(lines_out: List[str], ln: Dict[str, Any], *, indent: int
         lines_out.append(f"{_indent(indent + 2)}text={_fmt_text_one_line(text)}")
 
     lines_out.append(f"{_indent(indent + 2)}tokens:")
+    pad = _indent(indent + 4)
     for t in toks:
         tid = t.get("token_id")
         tb = _fmt_bbox(t.get("bbox"))
         conf = t.get("confidence")
         txt = t.get("text")
-        lines_out.append(
-            f"{_indent(indent + 4)}- {tid} bbox={tb} conf={_num(conf)} text={_fmt_text_one_line(txt)}"
-        )
+        lines_out.append(f"{pad}- {tid} bbox={tb} conf={_num(conf)} text={_fmt_text_one_line(txt)}")
 
 
 def write_report_file(*, report_dir: Path, report_name: str, text: str) -> Path:
@@ -1003,6 +1089,12 @@ def main(argv: Optional[List[str]] = None) -> int:
         help="Collision resolution strategy.",
     )
     ap.add_argument("--grid-show-conf", action="store_true", default=False, help='Append "@0.92" confidence marker.')
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for rendering token grids / ASCII maps (default 1: render in-process; 0: one per CPU).",
+    )
     ap.add_argument(
         "--no-ascii",
         action="store_true",
@@ -1013,7 +1105,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     args = ap.parse_args(argv)
 
     input_path = Path(args.input)
-    kind, input_payload, pages = load_pages_from_input(input_path)
+    kind, input_payload, pages = load_pages_from_input(input_path, page_filter=args.page)
 
     if args.page is not None and kind == "doc":
         pages = [(pn, pp) for (pn, pp) in pages if pn == args.page]
@@ -1029,6 +1121,11 @@ def main(argv: Optional[List[str]] = None) -> int:
     print(f"Input: {input_path}")
     print(f"Mode: {kind}  Pages: {len(pages)}")
 
+    # Both the token grid and the ASCII map scale to the page bounds; walk each page's bboxes once.
+    page_bounds: Optional[List[Tuple[int, int, int, int]]] = None
+    if args.write_token_grid and not args.no_ascii:
+        page_bounds = [_page_bounds(_collect_all_bboxes(pp)) for _, pp in pages]
+
     wrote_any = False
     out_base: Path | None = None
     doc_id = _resolve_doc_id(kind=kind, input_path=input_path, input_payload=input_payload, pages=pages)
@@ -1068,6 +1165,8 @@ def main(argv: Optional[List[str]] = None) -> int:
                 max_token_len=args.grid_max_token_len,
                 collision=args.grid_collision,
                 show_conf=args.grid_show_conf,
+                page_bounds=page_bounds,
+                jobs=args.jobs,
             )
             for p in grid_paths:
                 print(f"Wrote token grid: {p}")
@@ -1093,17 +1192,26 @@ def main(argv: Optional[List[str]] = None) -> int:
         idx.write_text("\n".join(idx_lines).rstrip() + "\n", encoding="utf-8")
         print(f"Wrote index: {idx}")
 
-    for (page_num, page_payload) in pages:
+    render_map = functools.partial(
+        render_ascii_map,
+        width=max(20, int(args.width)),
+        height=max(10, int(args.height)),
+        show_blocks=show_blocks,
+        show_lines=show_lines,
+        show_tokens=show_tokens,
+    )
+    # With --jobs, maps are rendered up front in parallel; otherwise page by page as printed.
+    ascii_maps: Optional[List[str]] = None
+    if not args.no_ascii and args.jobs != 1:
+        ascii_maps = _render_pages(render_map, pages, page_bounds=page_bounds, jobs=args.jobs)
+
+    for i, (page_num, page_payload) in enumerate(pages):
         print_page_summary(page_payload, show_text=args.show_text, max_snippet=args.max_snippet)
         if not args.no_ascii:
-            ascii_map = render_ascii_map(
-                page_payload,
-                width=max(20, int(args.width)),
-                height=max(10, int(args.height)),
-                show_blocks=show_blocks,
-                show_lines=show_lines,
-                show_tokens=show_tokens,
-            )
+            if ascii_maps is not None:
+                ascii_map = ascii_maps[i]
+            else:
+                ascii_map = render_map(page_payload, bounds=page_bounds[i] if page_bounds is not None else None)
             print("\n" + ascii_map + "\n")
 
     return 0